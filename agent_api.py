@@ -7,26 +7,52 @@ Modes:
   --write-env PATH  Write allowed credentials to a file (KEY=VALUE)
   --mcp             MCP (Model Context Protocol) stdio server
 
-Owner controls access via .check_please_agent_permissions.json.
-Zero new dependencies — stdlib only (+ python-dotenv for .env parsing).
+Owner controls access via .check_please_agent_permissions.json (the HTTP
+server picks up edits to it and to .env within a second, without a restart). Access logging
+to agent_access.log is governed by CHECK_PLEASE_AUDIT: "all" (default),
+"denied" (only refused requests) or "0" (off).
+Zero new dependencies — stdlib only (+ python-dotenv for .env files that use
+quoting/interpolation beyond plain KEY=value lines; orjson is used for
+serialization when installed).
 """
 
 from __future__ import annotations
 
+import atexit
 import hmac
+import io
 import json
 import os
+import queue
 import secrets
 import shlex
+import socket
 import subprocess
 import sys
 import time
 from datetime import datetime, timezone
+from http import HTTPStatus
 from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
 from typing import Optional
 
-from dotenv import dotenv_values
+from credential_auditor.envfile import parse_simple
+
+try:
+    import orjson  # optional: C serializer, returns bytes directly
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj: object) -> bytes:
+        # Compact like orjson: no spaces after "," and ":"
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads  # accepts bytes directly
 
 
 DEFAULT_PORT = 8458
@@ -34,6 +60,11 @@ PERMISSIONS_FILE = ".check_please_agent_permissions.json"
 LOG_FILE = "agent_access.log"
 USAGE_LOG = "agent_usage.log"
 MAX_BODY_BYTES = 10_485_760  # 10 MB
+KEEPALIVE_TIMEOUT = 30  # seconds an idle keep-alive connection is held open
+RELOAD_CHECK_INTERVAL = 1.0  # seconds between broker checks for permissions/.env edits
+
+
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
 
 
 def _parse_duration(s: str) -> float:
@@ -42,118 +73,150 @@ def _parse_duration(s: str) -> float:
     if not s:
         return 0
     s = str(s).strip()
-    units = {"s": 1, "m": 60, "h": 3600, "d": 86400}
-    # Plain number = seconds
+    # Dispatch on the suffix so '30m' never goes through a failed float('30m')
+    mult = _UNITS.get(s[-1:].lower())
     try:
-        return float(s)
+        return float(s[:-1]) * mult if mult else float(s)  # no suffix = seconds
     except ValueError:
-        pass
-    try:
-        return float(s[:-1]) * units[s[-1].lower()]
-    except (KeyError, ValueError, IndexError):
         return 0
 
 
-from collections import deque
+from collections import defaultdict
 import threading
 import urllib.request
 
 
+class _RpmWindow:
+    """Requests in the last 60 seconds, counted in per-second buckets.
+
+    Admission is O(1): stale buckets are zeroed as the clock advances and a
+    running total is kept, instead of storing and evicting one timestamp per
+    request. Seconds come from time.monotonic(), so wall-clock jumps don't
+    empty or freeze the window.
+    """
+
+    __slots__ = ("buckets", "last", "total")
+
+    def __init__(self, sec: int):
+        self.buckets = [0] * 60
+        self.last = sec
+        self.total = 0
+
+    def advance(self, sec: int) -> int:
+        """Expire buckets older than 60s as of *sec*; return the live total."""
+        gap = sec - self.last
+        if gap > 0:
+            buckets = self.buckets
+            if gap >= 60:
+                buckets[:] = [0] * 60
+                self.total = 0
+            else:
+                for s in range(self.last + 1, sec + 1):
+                    i = s % 60
+                    self.total -= buckets[i]
+                    buckets[i] = 0
+            self.last = sec
+        return self.total
+
+    def add(self, sec: int) -> None:
+        self.advance(sec)
+        # Never behind self.last with a monotonic clock; guard anyway
+        self.buckets[max(sec, self.last) % 60] += 1
+        self.total += 1
+
+
+_TRACKER_SHARDS = 16  # power of two: shard index is hash(key) & (N - 1)
+
+
 class _UsageTracker:
-    """In-memory usage counters with RPM sliding window and token totals."""
+    """In-memory usage counters with RPM sliding window and token totals.
+
+    State for a key is guarded by one of _TRACKER_SHARDS locks picked by
+    the key's hash, so unrelated credentials don't contend; whole-tracker
+    reads take every shard in index order.
+    """
 
     def __init__(self, base_dir: Path):
         self._base_dir = base_dir
-        self._lock = threading.Lock()
-        # {key: deque of timestamps} for RPM
-        self._rpm_windows: dict[str, deque] = {}
+        self._locks = [threading.Lock() for _ in range(_TRACKER_SHARDS)]
+        # {key: per-second request buckets} for RPM
+        self._rpm_windows: dict[str, _RpmWindow] = {}
         # {key: total_requests}
-        self._requests: dict[str, int] = {}
+        self._requests: defaultdict[str, int] = defaultdict(int)
         # {key: total_tokens}
-        self._tokens: dict[str, int] = {}
+        self._tokens: defaultdict[str, int] = defaultdict(int)
         # {(key, agent): total_tokens}
-        self._tokens_by_agent: dict[tuple[str, str], int] = {}
+        self._tokens_by_agent: defaultdict[tuple[str, str], int] = defaultdict(int)
 
-    def _cleanup_if_empty(self, key: str) -> None:
-        """Remove empty deque to prevent unbounded growth (caller holds lock)."""
-        dq = self._rpm_windows.get(key)
-        if dq is not None and len(dq) == 0:
-            del self._rpm_windows[key]
+    def _lk(self, key: str) -> threading.Lock:
+        return self._locks[hash(key) & (_TRACKER_SHARDS - 1)]
 
     def record_request(self, key: str, agent: str = "") -> None:
-        now = time.time()
-        with self._lock:
-            self._requests[key] = self._requests.get(key, 0) + 1
-            if key not in self._rpm_windows:
-                self._rpm_windows[key] = deque()
-            dq = self._rpm_windows[key]
-            # Evict stale entries proactively on write path
-            while dq and dq[0] < now - 60:
-                dq.popleft()
-            dq.append(now)
+        sec = int(time.monotonic())
+        with self._lk(key):
+            self._requests[key] += 1
+            win = self._rpm_windows.get(key)
+            if win is None:
+                win = self._rpm_windows[key] = _RpmWindow(sec)
+            win.add(sec)
 
     def check_rpm(self, key: str, limit: int) -> str | None:
         """Return error string if over RPM limit, else None."""
         if limit <= 0:
             return None
-        now = time.time()
-        with self._lock:
-            dq = self._rpm_windows.get(key)
-            if not dq:
-                return None
-            # Evict entries older than 60s
-            while dq and dq[0] < now - 60:
-                dq.popleft()
-            if len(dq) >= limit:
-                return f"rate limit exceeded: {len(dq)}/{limit} RPM for {key}"
+        with self._lk(key):
+            rpm = self._rpm_unlocked(key)
+        if rpm >= limit:
+            return f"rate limit exceeded: {rpm}/{limit} RPM for {key}"
         return None
 
     def record_tokens(self, key: str, tokens: int, agent: str = "",
-                      model: str = "") -> None:
-        with self._lock:
-            self._tokens[key] = self._tokens.get(key, 0) + tokens
+                      model: str = "") -> int:
+        """Add *tokens* to *key*'s total and return the new total."""
+        with self._lk(key):
+            self._tokens[key] += tokens
+            total = self._tokens[key]
             if agent:
-                k = (key, agent)
-                self._tokens_by_agent[k] = self._tokens_by_agent.get(k, 0) + tokens
-        # Append to usage log
-        entry = {"ts": datetime.now(timezone.utc).isoformat(), "key": key,
-                 "tokens": tokens, "agent": agent, "model": model}
-        try:
-            with open(self._base_dir / USAGE_LOG, "a") as f:
-                f.write(json.dumps(entry) + "\n")
-        except OSError:
-            pass
+                self._tokens_by_agent[key, agent] += tokens
+        # Append to usage log (via the background log writer)
+        _enqueue_log(self._base_dir / USAGE_LOG,
+                     {"key": key, "tokens": tokens, "agent": agent, "model": model})
+        return total
 
     def _rpm_unlocked(self, key: str) -> int:
-        """Return current RPM. Caller must hold self._lock."""
-        now = time.time()
-        dq = self._rpm_windows.get(key)
-        if not dq:
+        """Return current RPM. Caller must hold the key's shard lock."""
+        win = self._rpm_windows.get(key)
+        if win is None:
             return 0
-        while dq and dq[0] < now - 60:
-            dq.popleft()
-        if len(dq) == 0:
-            # Clean up empty deques to prevent memory leak
+        rpm = win.advance(int(time.monotonic()))
+        if not rpm:
+            # Drop idle windows to prevent unbounded growth
             del self._rpm_windows[key]
-            return 0
-        return len(dq)
+        return rpm
 
     def get_rpm(self, key: str) -> int:
-        with self._lock:
+        with self._lk(key):
             return self._rpm_unlocked(key)
 
     def summary(self, key: str = "") -> dict:
-        # Must not call get_rpm() while holding the lock — Lock is non-reentrant
+        # Must not call get_rpm() while holding a lock — Locks are non-reentrant
         # and that deadlocks GET /usage (and MCP usage tooling).
-        with self._lock:
-            if key:
+        if key:
+            with self._lk(key):
                 return {"key": key, "requests": self._requests.get(key, 0),
                         "tokens": self._tokens.get(key, 0),
                         "rpm": self._rpm_unlocked(key)}
+        # Hold every shard so no key is inserted mid-iteration
+        for lock in self._locks:
+            lock.acquire()
+        try:
             return {k: {"requests": self._requests.get(k, 0),
                         "tokens": self._tokens.get(k, 0),
                         "rpm": self._rpm_unlocked(k)}
-                    for k in set(list(self._requests) + list(self._tokens))}
+                    for k in self._requests.keys() | self._tokens.keys()}
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
 
 
 def _send_alert(msg: str, webhook: str = "", key: str = "",
@@ -177,37 +240,86 @@ def _send_alert(msg: str, webhook: str = "", key: str = "",
                 return
         except Exception:
             return
-        payload = json.dumps({"text": f"🔔 check_please: {msg}",
-                              "key": key, "agent": agent}).encode()
+        payload = _dumps({"text": f"🔔 check_please: {msg}",
+                          "key": key, "agent": agent})
+        _enqueue_webhook(webhook, payload)
+
+
+# ── Webhook sender ──
+# Delivery can take up to the 5s timeout; one daemon thread does it so the
+# request that tripped the alert never waits on the webhook.
+
+_WEBHOOK_QUEUE_MAX = 256
+
+_webhook_q: queue.Queue = queue.Queue(maxsize=_WEBHOOK_QUEUE_MAX)
+_webhook_lock = threading.Lock()
+_webhook_sender: threading.Thread | None = None
+_webhook_dropped = 0  # alerts discarded because the queue was full
+
+
+def _webhook_loop() -> None:
+    global _webhook_dropped
+    while True:
+        url, payload = _webhook_q.get()
+        if _webhook_dropped:
+            # Reported on the next delivery, like log_dropped in the access log
+            n, _webhook_dropped = _webhook_dropped, 0
+            print(f"⚠ {n} webhook alert(s) dropped: delivery queue full", file=sys.stderr)
         try:
-            req = urllib.request.Request(webhook, data=payload,
-                                        headers={"Content-Type": "application/json"})
-            urllib.request.urlopen(req, timeout=5)
+            req = urllib.request.Request(url, data=payload,
+                                         headers={"Content-Type": "application/json"})
+            urllib.request.urlopen(req, timeout=5).close()
         except Exception:
             pass
+        finally:
+            _webhook_q.task_done()
+
+
+def _enqueue_webhook(url: str, payload: bytes) -> None:
+    global _webhook_sender, _webhook_dropped
+    if _webhook_sender is None:
+        with _webhook_lock:
+            if _webhook_sender is None:
+                _webhook_sender = threading.Thread(target=_webhook_loop,
+                                                   name="agent-webhook-sender", daemon=True)
+                _webhook_sender.start()
+    try:
+        _webhook_q.put_nowait((url, payload))
+    except queue.Full:
+        _webhook_dropped += 1
 
 
 class _CredScope:
     """Per-credential access scope (thread-safe for ThreadingHTTPServer)."""
 
-    __slots__ = ("max_uses", "expires_at", "uses", "rpm_limit", "_lock")
+    __slots__ = ("max_uses", "expires_at", "uses", "rpm_limit", "spec", "_lock", "_denied")
 
     def __init__(self, max_uses: int = 0, expires: str = "", rpm_limit: int = 0):
+        self.spec = (max_uses, expires, rpm_limit)  # as configured, for reload comparison
         self.max_uses = max_uses  # 0 = unlimited
         ttl = _parse_duration(expires)
         self.expires_at = time.time() + ttl if ttl > 0 else 0  # 0 = never
         self.uses = 0
         self.rpm_limit = rpm_limit  # 0 = unlimited
         self._lock = threading.Lock()
+        # Expiry and exhaustion are permanent, so the first denial is cached and
+        # later calls return it without taking the lock or reading the clock
+        self._denied: str | None = None
+
+    def _refusal(self) -> str | None:
+        # Caller holds self._lock
+        if self.expires_at and time.time() > self.expires_at:
+            self._denied = "credential access expired"
+        elif self.max_uses and self.uses >= self.max_uses:
+            self._denied = f"max uses ({self.max_uses}) exhausted"
+        return self._denied
 
     def check(self) -> str | None:
         """Return error string if access denied, else None."""
+        if self._denied:
+            return self._denied
         with self._lock:
-            if self.expires_at and time.time() > self.expires_at:
-                return "credential access expired"
-            if self.max_uses and self.uses >= self.max_uses:
-                return f"max uses ({self.max_uses}) exhausted"
-            return None
+            return self._refusal()
 
     def record_use(self):
         with self._lock:
@@ -215,27 +327,46 @@ class _CredScope:
 
     def check_and_record(self) -> str | None:
         """Atomic check+record to prevent race under ThreadingHTTPServer."""
+        if self._denied:
+            return self._denied
         with self._lock:
-            if self.expires_at and time.time() > self.expires_at:
-                return "credential access expired"
-            if self.max_uses and self.uses >= self.max_uses:
-                return f"max uses ({self.max_uses}) exhausted"
-            self.uses += 1
-            return None
+            denied = self._refusal()
+            if denied is None:
+                self.uses += 1
+            return denied
 
 
 def _load_env(env_path: Path) -> dict[str, str]:
-    vals = dotenv_values(env_path)
-    return {k: v for k, v in vals.items() if v}
+    try:
+        text = env_path.read_text(encoding="utf-8")
+    except (FileNotFoundError, IsADirectoryError):
+        return {}
+    env = parse_simple(text)
+    if env is None:
+        from dotenv import dotenv_values  # only for files the fast path can't read
+        env = dotenv_values(stream=io.StringIO(text))
+    # Interned names: lookups with the interned permission names hit
+    # the identity check in dict/set probing before any string compare
+    return {sys.intern(k): v for k, v in env.items() if v}
+
+
+# {permissions path: (file stamp, parsed permissions)} — repeated loads of an
+# unchanged file (e.g. --mcp loads it twice) share one parse and one set of
+# scope counters
+_perm_cache: dict[Path, tuple[tuple[int, int, int], dict]] = {}
 
 
 def _load_permissions(base_dir: Path) -> dict:
     p = base_dir / PERMISSIONS_FILE
-    if not p.exists():
-        return {"allowed": [], "deny_all": True, "scopes": {}, "token_ttl": 0,
-                "alerts": {}}
+    stamp = _file_stamp(p)
+    cached = _perm_cache.get(p)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    if stamp == (0, 0, 0):  # missing
+        return {"allowed": [], "allowed_set": frozenset(), "deny_all": True,
+                "scopes": {}, "token_ttl": 0, "alerts": {}}
     try:
-        data = json.loads(p.read_text())
+        data = _loads(p.read_bytes())
         if "allowed" not in data:
             data["allowed"] = []
         data["deny_all"] = False
@@ -243,10 +374,11 @@ def _load_permissions(base_dir: Path) -> dict:
         names, scopes = [], {}
         for entry in data["allowed"]:
             if isinstance(entry, str):
+                entry = sys.intern(entry)
                 names.append(entry)
                 scopes[entry] = _CredScope()
-            elif isinstance(entry, dict) and "name" in entry:
-                n = entry["name"]
+            elif isinstance(entry, dict) and isinstance(entry.get("name"), str):
+                n = sys.intern(entry["name"])
                 names.append(n)
                 scopes[n] = _CredScope(
                     max_uses=entry.get("max_uses", 0),
@@ -254,233 +386,659 @@ def _load_permissions(base_dir: Path) -> dict:
                     rpm_limit=entry.get("rpm_limit", 0),
                 )
         data["allowed"] = names
+        data["allowed_set"] = frozenset(names)  # O(1) membership on the request path
         data["scopes"] = scopes
         data["token_ttl"] = _parse_duration(data.get("token_ttl", ""))
         data["alerts"] = data.get("alerts", {})
+        _perm_cache[p] = (stamp, data)
         return data
-    except (json.JSONDecodeError, OSError):
-        return {"allowed": [], "deny_all": True, "scopes": {}, "token_ttl": 0,
-                "alerts": {}}
+    except (ValueError, OSError):  # JSONDecodeError and bad UTF-8 are ValueErrors
+        return {"allowed": [], "allowed_set": frozenset(), "deny_all": True,
+                "scopes": {}, "token_ttl": 0, "alerts": {}}
+
+
+def _file_stamp(path: Path) -> tuple[int, int, int]:
+    """Cheap change detector: (mtime_ns, size, inode), or zeros if missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (0, 0, 0)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _reload_permissions(base_dir: Path, previous: dict) -> dict:
+    """Re-read permissions, keeping live scopes whose config is unchanged.
+
+    Reusing the old _CredScope keeps its use count and expiry deadline, so
+    touching or re-saving the file can't reset an agent's limits. A missing,
+    truncated or half-written file denies everything but carries the live
+    scopes forward, so restoring it can't reset them either.
+    """
+    data = _load_permissions(base_dir)
+    old_scopes = previous.get("scopes", {})
+    if data["deny_all"]:
+        return {**data, "scopes": old_scopes} if old_scopes else data
+    for name, scope in data["scopes"].items():
+        kept = old_scopes.get(name)
+        if kept is not None and kept.spec == scope.spec:
+            data["scopes"][name] = kept
+    return data
+
+
+# ── Access / usage log writer ──
+# Request threads only enqueue (path, time_ns, entry); one daemon thread owns
+# timestamp formatting, serialization and the file I/O, and coalesces
+# whatever is queued into a single writev() per file on a kept-open fd.
+
+_LOG_QUEUE_MAX = 10_000
+_LOG_BATCH_MAX = 100
+
+_log_q: queue.Queue = queue.Queue(maxsize=_LOG_QUEUE_MAX)
+_log_writer_lock = threading.Lock()
+_log_writer: threading.Thread | None = None
+_log_dropped = 0  # lines discarded because the queue was full
+
+
+_ts_cache: tuple[int, str] = (-1, "")  # (epoch second, "YYYY-MM-DDTHH:MM:SS")
+
+
+def _iso_ts(ns: int) -> str:
+    """Format a time.time_ns() value like datetime.now(timezone.utc).isoformat().
+
+    The date/time prefix is cached per second, so a burst of log lines only
+    builds one datetime.
+    """
+    global _ts_cache
+    secs, rem = divmod(ns, 1_000_000_000)
+    cached_secs, prefix = _ts_cache
+    if secs != cached_secs:
+        prefix = datetime.fromtimestamp(secs, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _ts_cache = (secs, prefix)
+    us = rem // 1000
+    return f"{prefix}.{us:06d}+00:00" if us else prefix + "+00:00"
+
+
+_log_fds: dict[Path, int] = {}  # writer-thread only: persistent O_APPEND descriptors
+_writev = getattr(os, "writev", None)  # POSIX only; Windows falls back to write()
+_fdatasync = getattr(os, "fdatasync", os.fsync)  # macOS has no fdatasync
+
+
+def _log_fd(path: Path) -> int:
+    """Return an append fd for *path*, reopening it if the file was moved or deleted."""
+    fd = _log_fds.get(path)
+    if fd is not None:
+        try:
+            if os.stat(path).st_ino == os.fstat(fd).st_ino:
+                return fd
+        except OSError:
+            pass
+        os.close(fd)
+        del _log_fds[path]
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+    _log_fds[path] = fd
+    return fd
+
+
+def _write_log_batch(batch: list[tuple[Path, int, dict]]) -> None:
+    by_path: dict[Path, list[bytes]] = {}
+    for path, ns, entry in batch:
+        line = _dumps({"ts": _iso_ts(ns), **entry}) + b"\n"
+        by_path.setdefault(path, []).append(line)
+    for path, lines in by_path.items():
+        try:
+            _write_lines(_log_fd(path), lines)
+        except OSError:
+            pass
+
+
+def _write_lines(fd: int, lines: list[bytes]) -> None:
+    """Append *lines* to *fd*: one writev() call, or one write() where it's missing."""
+    if _writev is not None:
+        written = _writev(fd, lines)
+        total = sum(map(len, lines))
+        if written == total:
+            return
+        # Short gather write (disk full, signal): finish the rest with write()
+        data = memoryview(b"".join(lines))[written:]
+    else:
+        data = memoryview(b"".join(lines))
+    while data:
+        data = data[os.write(fd, data):]
+
+
+def _log_writer_loop() -> None:
+    global _log_dropped
+    while True:
+        item = _log_q.get()
+        batch = [item]
+        while len(batch) < _LOG_BATCH_MAX:
+            try:
+                batch.append(_log_q.get_nowait())
+            except queue.Empty:
+                break
+        stop = None in batch
+        items = [it for it in batch if it is not None]
+        if _log_dropped and items:
+            n, _log_dropped = _log_dropped, 0
+            items.append((items[0][0], time.time_ns(), {"event": "log_dropped", "count": n}))
+        _write_log_batch(items)
+        for _ in batch:
+            _log_q.task_done()
+        if stop:
+            return
+
+
+def _enqueue_log(path: Path, entry: dict) -> None:
+    """Queue *entry* for *path*; the writer adds the "ts" field."""
+    global _log_writer, _log_dropped
+    if _log_writer is None:
+        with _log_writer_lock:
+            if _log_writer is None:
+                _log_writer = threading.Thread(target=_log_writer_loop,
+                                               name="agent-log-writer", daemon=True)
+                _log_writer.start()
+    try:
+        _log_q.put_nowait((path, time.time_ns(), entry))
+    except queue.Full:
+        _log_dropped += 1
+
+
+def _flush_logs() -> None:
+    """Block until every queued log line has been written."""
+    if _log_writer is not None and _log_writer.is_alive():
+        _log_q.join()
+
+
+@atexit.register
+def _stop_log_writer() -> None:
+    # One-shot modes (--export, --env, --mcp) exit right after logging
+    if _log_writer is not None and _log_writer.is_alive():
+        _log_q.put(None)
+        _log_writer.join(timeout=5)
+        if not _log_writer.is_alive():
+            # Access logs don't need per-line durability; sync once on the way out
+            for fd in _log_fds.values():
+                try:
+                    _fdatasync(fd)
+                except OSError:
+                    pass
+                os.close(fd)
+            _log_fds.clear()
+
+
+def _audit_level(value: str) -> int:
+    """Map CHECK_PLEASE_AUDIT to 2 (log everything), 1 (denials only) or 0 (off)."""
+    value = value.strip().lower()
+    if value in ("0", "off", "false", "none"):
+        return 0
+    if value == "denied":
+        return 1
+    return 2
+
+
+_AUDIT_LEVEL = _audit_level(os.environ.get("CHECK_PLEASE_AUDIT", "all"))
 
 
 def _log_access(base_dir: Path, event: str, env_var: str = "", agent: str = "", granted: bool = False):
-    entry = {
-        "ts": datetime.now(timezone.utc).isoformat(),
+    if _AUDIT_LEVEL < 2 and (granted or not _AUDIT_LEVEL):
+        return
+    _enqueue_log(base_dir / LOG_FILE, {
         "event": event,
         "env_var": env_var,
         "agent": agent,
         "granted": granted,
-    }
+    })
+
+
+def _group_by_provider(env_vars: dict[str, str]) -> Optional[dict[str, list[str]]]:
+    """Group env var names by detected provider — names only, never values.
+
+    Returns None when the provider package can't be imported (e.g. httpx
+    isn't installed).
+    """
     try:
-        with open(base_dir / LOG_FILE, "a") as f:
-            f.write(json.dumps(entry) + "\n")
-    except OSError:
-        pass
+        from credential_auditor.providers import Provider, discover_providers, env_var_matcher
+    except ImportError:
+        return None
+    discover_providers()
+    # Same routing as audit() and --dry-run: one combined env_patterns match
+    # per variable, falling back to per-provider checks for overrides
+    match_provider = env_var_matcher(Provider.get_registry())
+    providers: dict[str, list[str]] = {}
+    for var in env_vars:
+        name = match_provider(var)
+        if name is not None:
+            providers.setdefault(name, []).append(var)
+    return providers
+
+
+_REASONS = {s.value: s.phrase.encode() for s in HTTPStatus}
+# Standard security headers sent on every broker response
+_SEC_HEADERS = (
+    b"X-Content-Type-Options: nosniff\r\n"
+    b"X-Frame-Options: DENY\r\n"
+    b"Referrer-Policy: no-referrer\r\n"
+    b"Cache-Control: no-store\r\n"
+)
+
+# Request versions the fast header parser accepts -> initial close_connection
+_FAST_VERSIONS = {b"HTTP/1.1": False, b"HTTP/1.0": True}
+_MAX_HEADERS = 100  # same limits as http.client
+_MAX_HEADER_LINE = 65536
+
+# Fixed response bodies, encoded once. Bodies that echo request data are
+# still built per request so the JSON encoder does the escaping.
+_OK_BODY = _dumps({"status": "ok"})
+_NO_PERMS_BODY = _dumps({"error": "No permissions configured"})
+_NO_PERMS_SETUP_BODY = _dumps({"error": "No permissions configured",
+                               "setup": f"Create {PERMISSIONS_FILE} with allowed env var names"})
+_EMPTY_USAGE_BODY = _dumps({"usage": {}})
+_BAD_LENGTH_BODY = _dumps({"error": "Invalid Content-Length"})
+_TOO_LARGE_BODY = _dumps({"error": "Request body too large"})
+_BAD_JSON_BODY = _dumps({"error": "invalid JSON"})
+_BAD_TOKENS_BODY = _dumps({"error": "tokens must be an integer"})
+_TOKENS_RANGE_BODY = _dumps({"error": "tokens out of range"})
+_NO_REGISTRY_BODY = _dumps({"error": "provider registry not available"})
+_NO_METRICS_BODY = _dumps({"error": "metrics module not available"})
+
+_CRED_PREFIX = "/credentials/"
+_CRED_PREFIX_LEN = len(_CRED_PREFIX)
+_USAGE_PREFIX = "/usage/"
+_USAGE_PREFIX_LEN = len(_USAGE_PREFIX)
+
+
+class _AgentHTTPServer(ThreadingHTTPServer):
+    """Threaded broker server with a deeper accept backlog.
+
+    ThreadingHTTPServer already uses daemon threads and SO_REUSEADDR; the
+    stdlib backlog of 5 drops connections when many agents start at once.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+    # Set only for --workers N: any local process of the same user could
+    # then bind the port too, so it stays off for the single-listener case.
+    reuse_port = False
+
+    def server_bind(self):
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
+class _ReusePortHTTPServer(_AgentHTTPServer):
+    reuse_port = True
+
+
+def _bind_servers(port: int, handler, workers: int = 1) -> list[_AgentHTTPServer]:
+    """Bind *workers* listeners on one port; the kernel spreads accepts across them.
+
+    With more than one worker every socket is bound with SO_REUSEPORT (Linux
+    and BSDs). Falls back to a single listener where that isn't available.
+    """
+    if workers <= 1 or not hasattr(socket, "SO_REUSEPORT"):
+        return [_AgentHTTPServer(("127.0.0.1", port), handler)]
+    first = _ReusePortHTTPServer(("127.0.0.1", port), handler)
+    port = first.server_address[1]  # resolve port 0 once so all workers share it
+    return [first] + [_ReusePortHTTPServer(("127.0.0.1", port), handler)
+                      for _ in range(workers - 1)]
 
 
 def _make_handler(token: str, env_vars: dict[str, str], permissions: dict, base_dir: Path,
-                  token_expires: float = 0, tracker: _UsageTracker | None = None):
+                  token_expires: float = 0, tracker: _UsageTracker | None = None,
+                  env_path: Optional[Path] = None,
+                  reload_interval: float = RELOAD_CHECK_INTERVAL):
+
+    # Whole-header compare: one constant-time check, no per-request slicing
+    expected_auth = ("Bearer " + token).encode()
+
+    # Permissions (and .env, when env_path is given) are hot-reloaded when
+    # the file changes — checked at most once per reload_interval seconds;
+    # responses derived from them are encoded once per version, not once
+    # per request.
+    perm_path = base_dir / PERMISSIONS_FILE
+    reload_lock = threading.Lock()
+
+    def _env_bodies(env: dict[str, str]) -> tuple[bytes, bytes]:
+        grouped = _group_by_provider(env)
+        providers = _dumps({"providers": grouped}) if grouped is not None else b""
+        health = _dumps({"status": "ok", "credentials_loaded": len(env)})
+        return providers, health
+
+    def _stamp() -> tuple:
+        return _file_stamp(perm_path), _file_stamp(env_path) if env_path else None
+
+    def _snapshot(perms: dict, env: dict[str, str], env_bodies: tuple[bytes, bytes],
+                  stamp: tuple) -> dict:
+        allowed = [v for v in perms["allowed"] if v in env]
+        alerts = perms["alerts"]
+        return {
+            "stamp": stamp,
+            "permissions": perms,
+            # Hoisted per version so handlers don't re-walk the permissions dict
+            "scopes": perms["scopes"],
+            "webhook": alerts.get("webhook", ""),
+            "token_threshold": alerts.get("token_threshold", 0),
+            "env_vars": env,
+            "providers_body": env_bodies[0],
+            "health_body": env_bodies[1],
+            "creds_body": _dumps({"allowed_credentials": allowed, "total": len(allowed)}),
+            # Success body per grantable var; scope/RPM checks still run per request
+            "grant_bodies": {v: _dumps({"env_var": v, "value": env[v]}) for v in allowed},
+        }
+
+    current = [_snapshot(permissions, env_vars, _env_bodies(env_vars), _stamp())]
+    last_check = [time.monotonic()]
+
+    def _current() -> dict:
+        snap = current[0]
+        if reload_interval:
+            now = time.monotonic()
+            if now - last_check[0] < reload_interval:
+                return snap
+            last_check[0] = now
+        stamp = _stamp()
+        if stamp != snap["stamp"]:
+            with reload_lock:
+                snap = current[0]
+                old = snap["stamp"]
+                if stamp != old:
+                    perms, env = snap["permissions"], snap["env_vars"]
+                    env_bodies = snap["providers_body"], snap["health_body"]
+                    if stamp[0] != old[0]:
+                        perms = _reload_permissions(base_dir, perms)
+                    if stamp[1] != old[1]:
+                        env = _load_env(env_path)
+                        env_bodies = _env_bodies(env)
+                    snap = _snapshot(perms, env, env_bodies, stamp)
+                    current[0] = snap
+        return snap
 
     class Handler(BaseHTTPRequestHandler):
+        # Keep-alive: agents polling the broker reuse one connection. Every
+        # response carries Content-Length, and idle sockets time out so they
+        # don't pin a worker thread forever.
+        protocol_version = "HTTP/1.1"
+        timeout = KEEPALIVE_TIMEOUT
+
+        def setup(self):
+            super().setup()
+            # Responses are small and latency-bound — don't let Nagle hold them back
+            try:
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                pass
+
         def log_message(self, format, *args):
             pass  # suppress default stderr logging
 
-        def _sec_headers(self) -> None:
-            """Send standard security headers on all responses."""
-            self.send_header("X-Content-Type-Options", "nosniff")
-            self.send_header("X-Frame-Options", "DENY")
-            self.send_header("Referrer-Policy", "no-referrer")
-            self.send_header("Cache-Control", "no-store")
+        def parse_request(self) -> bool:
+            """Fast path for the plain ``METHOD /path HTTP/1.x`` requests agents send.
+
+            Headers are read line by line into a dict keyed by lower-cased name,
+            skipping the email.parser pass behind http.client.parse_headers.
+            Anything unusual is handed to the stdlib parser. Handlers look
+            headers up by lower-case name, which works with either result.
+            """
+            words = self.raw_requestline.split()
+            if len(words) != 3 or words[2] not in _FAST_VERSIONS or words[1].startswith(b"//"):
+                return super().parse_request() and self._check_framing()
+            self.command = words[0].decode("latin-1")
+            self.path = words[1].decode("latin-1")
+            self.request_version = words[2].decode("latin-1")
+            self.requestline = self.raw_requestline.decode("latin-1").rstrip("\r\n")
+            self.close_connection = _FAST_VERSIONS[words[2]]
+
+            headers: dict[str, str] = {}
+            readline = self.rfile.readline
+            for _ in range(_MAX_HEADERS + 1):
+                line = readline(_MAX_HEADER_LINE + 1)
+                if len(line) > _MAX_HEADER_LINE:
+                    self.send_error(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Line too long")
+                    return False
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, sep, value = line.partition(b":")
+                if not sep or not name or name[:1] in b" \t":
+                    # Folded or malformed header line — no need to support it here
+                    self.send_error(HTTPStatus.BAD_REQUEST, "Bad header line")
+                    return False
+                # First occurrence wins, as with email.message.Message.get
+                key = name.strip().lower().decode("latin-1")
+                val = value.strip().decode("latin-1")
+                if headers.setdefault(key, val) != val and key == "content-length":
+                    # Conflicting lengths leave the message boundary ambiguous
+                    self.close_connection = True
+                    self.send_error(HTTPStatus.BAD_REQUEST, "Conflicting Content-Length")
+                    return False
+            else:
+                self.send_error(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Too many headers")
+                return False
+            self.headers = headers
+
+            conntype = headers.get("connection", "").lower()
+            if conntype == "close":
+                self.close_connection = True
+            elif conntype == "keep-alive":
+                self.close_connection = False
+            if not self._check_framing():
+                return False
+            if (headers.get("expect", "").lower() == "100-continue"
+                    and self.request_version == "HTTP/1.1"):
+                return self.handle_expect_100()
+            return True
+
+        def _check_framing(self) -> bool:
+            """Keep unread body bytes from being parsed as the next request.
+
+            Only the POST handlers consume a body, and only by Content-Length.
+            Chunked (or any other Transfer-Encoding) bodies are refused outright;
+            a body on any other method closes the connection after the reply.
+            """
+            if self.headers.get("transfer-encoding") is not None:
+                self.close_connection = True
+                self.send_error(HTTPStatus.NOT_IMPLEMENTED, "Transfer-Encoding not supported")
+                return False
+            get_all = getattr(self.headers, "get_all", None)  # stdlib-parsed headers
+            if get_all is not None and len(set(get_all("content-length") or ())) > 1:
+                self.close_connection = True
+                self.send_error(HTTPStatus.BAD_REQUEST, "Conflicting Content-Length")
+                return False
+            if self.command != "POST" and self.headers.get("content-length", "0") != "0":
+                self.close_connection = True
+            return True
 
         def _check_auth(self) -> Optional[str]:
             if token_expires and time.time() > token_expires:
                 self.send_error(401, "Bearer token expired")
                 _log_access(base_dir, "token_expired")
                 return None
-            auth = self.headers.get("Authorization", "")
-            if not auth.startswith("Bearer "):
-                self.send_error(401, "Invalid or missing bearer token")
-                _log_access(base_dir, "auth_failed")
-                return None
-            presented = auth[7:]
-            # Constant-time compare — reject length mismatch without leaking via short-circuit
-            if not hmac.compare_digest(presented, token):
+            # Headers are decoded as latin-1, so encoding back is lossless and
+            # compare_digest never sees non-ASCII str (which it rejects)
+            auth = self.headers.get("authorization", "").encode("latin-1", "replace")
+            if not hmac.compare_digest(auth, expected_auth):
                 self.send_error(401, "Invalid or missing bearer token")
                 _log_access(base_dir, "auth_failed")
                 return None
-            return presented
+            return token
 
         def _json_response(self, code: int, data: dict):
-            body = json.dumps(data).encode()
-            self.send_response(code)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(body)))
-            self.send_header("X-Content-Type-Options", "nosniff")
-            self.send_header("X-Frame-Options", "DENY")
-            self.send_header("Referrer-Policy", "no-referrer")
-            self.send_header("Cache-Control", "no-store")
-            self.end_headers()
-            self.wfile.write(body)
+            self._send_json(code, _dumps(data))
+
+        def _send_json(self, code: int, body: bytes):
+            """Send an already-encoded JSON body."""
+            self._send(code, body, b"application/json")
+
+        def _send(self, code: int, body: bytes, content_type: bytes):
+            """Write status line, headers and body with a single write."""
+            self.wfile.write(b"%s %d %s\r\nContent-Type: %s\r\nContent-Length: %d\r\n%s%s\r\n%s" % (
+                self.protocol_version.encode(), code, _REASONS.get(code, b""),
+                content_type, len(body), _SEC_HEADERS,
+                b"Connection: close\r\n" if self.close_connection else b"", body))
 
         def _get_agent_id(self) -> str:
-            return self.headers.get("X-Agent-Id", "unknown")
+            return self.headers.get("x-agent-id", "unknown")
 
-        def _read_body(self) -> bytes:
-            raw_len = self.headers.get("Content-Length", "0")
+        def _read_body(self) -> Optional[bytes]:
+            """Consume the request body; on error respond and return None."""
+            raw_len = self.headers.get("content-length", "0")
             try:
                 length = int(raw_len)
             except (TypeError, ValueError):
-                self._json_response(400, {"error": "Invalid Content-Length"})
-                return b""
+                length = -1
             if length < 0:
-                self._json_response(400, {"error": "Invalid Content-Length"})
-                return b""
+                # Can't find the end of this message — drop the connection after replying
+                self.close_connection = True
+                self._send_json(400, _BAD_LENGTH_BODY)
+                return None
             if length > MAX_BODY_BYTES:
-                self._json_response(413, {"error": "Request body too large"})
-                return b""
+                self.close_connection = True
+                self._send_json(413, _TOO_LARGE_BODY)
+                return None
             return self.rfile.read(length) if length else b""
 
-        def do_GET(self):
-            if not self._check_auth():
+        # ── GET routes ──
+
+        def _get_providers(self):
+            # List env var names grouped by detected provider — no values
+            providers_body = _current()["providers_body"]
+            if not providers_body:
+                self._send_json(503, _NO_REGISTRY_BODY)
+                return
+            _log_access(base_dir, "list_providers", agent=self._get_agent_id(), granted=True)
+            self._send_json(200, providers_body)
+
+        def _get_credentials(self):
+            # List allowed credential names — no values
+            snap = _current()
+            if snap["permissions"].get("deny_all"):
+                self._send_json(403, _NO_PERMS_SETUP_BODY)
                 return
+            _log_access(base_dir, "list_credentials", agent=self._get_agent_id(), granted=True)
+            self._send_json(200, snap["creds_body"])
 
-            if self.path == "/providers":
-                # List env var names grouped by detected provider — no values
-                from credential_auditor.providers import discover_providers, Provider
-                discover_providers()
-                registry = Provider.get_registry()
-                providers = {}
-                for var in env_vars:
-                    for name, cls in registry.items():
-                        inst = cls()
-                        if inst.matches_env_var(var):
-                            providers.setdefault(name, []).append(var)
-                            break
-                _log_access(base_dir, "list_providers", agent=self._get_agent_id(), granted=True)
-                self._json_response(200, {"providers": providers})
-
-            elif self.path == "/credentials":
-                # List allowed credential names — no values
-                if permissions.get("deny_all"):
-                    self._json_response(403, {"error": "No permissions configured",
-                                               "setup": f"Create {PERMISSIONS_FILE} with allowed env var names"})
-                    return
-                allowed = [v for v in permissions["allowed"] if v in env_vars]
-                _log_access(base_dir, "list_credentials", agent=self._get_agent_id(), granted=True)
-                self._json_response(200, {"allowed_credentials": allowed, "total": len(allowed)})
+        def _get_health(self):
+            self._send_json(200, _current()["health_body"])
 
-            elif self.path == "/health":
-                self._json_response(200, {"status": "ok", "credentials_loaded": len(env_vars)})
+        def _get_usage(self):
+            if tracker:
+                self._json_response(200, {"usage": tracker.summary()})
+            else:
+                self._send_json(200, _EMPTY_USAGE_BODY)
 
-            elif self.path == "/usage":
-                if tracker:
-                    self._json_response(200, {"usage": tracker.summary()})
-                else:
-                    self._json_response(200, {"usage": {}})
+        def _get_metrics(self):
+            # Prometheus-compatible text exposition
+            try:
+                from credential_auditor.metrics import render_metrics
 
-            elif self.path == "/metrics":
-                # Prometheus-compatible text exposition
-                try:
-                    from credential_auditor.metrics import render_metrics
-
-                    body = render_metrics().encode()
-                    self.send_response(200)
-                    self.send_header("Content-Type", "text/plain; version=0.0.4")
-                    self.send_header("Content-Length", str(len(body)))
-                    self._sec_headers()
-                    self.end_headers()
-                    self.wfile.write(body)
-                except ImportError:
-                    self._json_response(503, {"error": "metrics module not available"})
-
-            elif self.path.startswith("/usage/"):
-                key = self.path[len("/usage/"):]
-                if tracker:
-                    s = tracker.summary(key)
-                    s["rpm_limit"] = 0
-                    scope = permissions.get("scopes", {}).get(key)
-                    if scope:
-                        s["rpm_limit"] = scope.rpm_limit
-                    self._json_response(200, s)
-                else:
-                    self._json_response(200, {"key": key, "requests": 0, "tokens": 0, "rpm": 0})
+                self._send(200, render_metrics().encode(), b"text/plain; version=0.0.4")
+            except ImportError:
+                self._send_json(503, _NO_METRICS_BODY)
 
+        def _get_key_usage(self, key: str):
+            if tracker:
+                s = tracker.summary(key)
+                s["rpm_limit"] = 0
+                scope = _current()["scopes"].get(key)
+                if scope:
+                    s["rpm_limit"] = scope.rpm_limit
+                self._json_response(200, s)
             else:
-                self.send_error(404)
+                self._json_response(200, {"key": key, "requests": 0, "tokens": 0, "rpm": 0})
 
-        def do_POST(self):
+        _GET_ROUTES = {
+            "/providers": _get_providers,
+            "/credentials": _get_credentials,
+            "/health": _get_health,
+            "/usage": _get_usage,
+            "/metrics": _get_metrics,
+        }
+
+        def do_GET(self):
             if not self._check_auth():
                 return
+            path = self.path
+            route = self._GET_ROUTES.get(path)
+            if route is not None:
+                route(self)
+            elif path.startswith(_USAGE_PREFIX):
+                self._get_key_usage(path[_USAGE_PREFIX_LEN:])
+            else:
+                self.send_error(404)
 
-            agent = self._get_agent_id()
+        # ── POST routes ──
 
-            # POST /usage — agent reports token usage
-            if self.path == "/usage":
-                if not tracker:
-                    self._json_response(200, {"status": "ok"})
-                    return
-                try:
-                    data = json.loads(self._read_body())
-                except (json.JSONDecodeError, ValueError):
-                    self._json_response(400, {"error": "invalid JSON"})
-                    return
-                key = data.get("key", "")
-                try:
-                    tokens = int(data.get("tokens", 0))
-                except (TypeError, ValueError):
-                    self._json_response(400, {"error": "tokens must be an integer"})
-                    return
-                if tokens < 0 or tokens > 1_000_000_000:
-                    self._json_response(400, {"error": "tokens out of range"})
-                    return
-                model = data.get("model", "")
-                if not isinstance(model, str):
-                    model = str(model)
-                if key and tokens > 0:
-                    tracker.record_tokens(key, tokens, agent=agent, model=model)
-                    # Check alert thresholds
-                    alerts = permissions.get("alerts", {})
-                    token_threshold = alerts.get("token_threshold", 0)
-                    if token_threshold and tracker.summary(key).get("tokens", 0) >= token_threshold:
-                        _send_alert(f"{key} exceeded {token_threshold} tokens",
-                                    webhook=alerts.get("webhook", ""),
-                                    key=key, agent=agent)
-                self._json_response(200, {"status": "ok"})
+        def _post_usage(self, agent: str):
+            # Agent reports token usage
+            body = self._read_body()
+            if body is None:
                 return
-
-            # POST /credentials/{env_var} — get actual value
-            if not self.path.startswith("/credentials/"):
-                self.send_error(404)
+            if not tracker:
+                self._send_json(200, _OK_BODY)
                 return
-
-            var_name = self.path[len("/credentials/"):]
+            try:
+                data = _loads(body)
+            except ValueError:
+                self._send_json(400, _BAD_JSON_BODY)
+                return
+            key = data.get("key", "")
+            try:
+                tokens = int(data.get("tokens", 0))
+            except (TypeError, ValueError):
+                self._send_json(400, _BAD_TOKENS_BODY)
+                return
+            if tokens < 0 or tokens > 1_000_000_000:
+                self._send_json(400, _TOKENS_RANGE_BODY)
+                return
+            model = data.get("model", "")
+            if not isinstance(model, str):
+                model = str(model)
+            if key and tokens > 0:
+                total = tracker.record_tokens(key, tokens, agent=agent, model=model)
+                # Alert once, on the report that crosses the threshold
+                snap = _current()
+                token_threshold = snap["token_threshold"]
+                if token_threshold and total - tokens < token_threshold <= total:
+                    _send_alert(f"{key} exceeded {token_threshold} tokens",
+                                webhook=snap["webhook"], key=key, agent=agent)
+            self._send_json(200, _OK_BODY)
+
+        def _post_credential(self, var_name: str, agent: str):
+            # Return the actual value of an allowed credential. The body is
+            # unused but must be consumed so the connection can be reused.
+            if self._read_body() is None:
+                return
+            snap = _current()
+            permissions = snap["permissions"]
 
             if permissions.get("deny_all"):
                 _log_access(base_dir, "credential_request", env_var=var_name, agent=agent, granted=False)
-                self._json_response(403, {"error": "No permissions configured"})
-                return
-
-            if var_name not in permissions["allowed"]:
-                _log_access(base_dir, "credential_denied", env_var=var_name, agent=agent, granted=False)
-                self._json_response(403, {"error": f"Access to {var_name} not permitted",
-                                           "hint": f"Add \"{var_name}\" to allowed list in {PERMISSIONS_FILE}"})
+                self._send_json(403, _NO_PERMS_BODY)
                 return
 
-            if var_name not in env_vars:
-                _log_access(base_dir, "credential_not_found", env_var=var_name, agent=agent, granted=False)
-                self._json_response(404, {"error": f"{var_name} not found in .env"})
+            # Allowed and present in .env exactly when a grant body was built,
+            # so the common case is one lookup; misses work out which it was
+            grant_body = snap["grant_bodies"].get(var_name)
+            if grant_body is None:
+                if var_name not in permissions["allowed_set"]:
+                    _log_access(base_dir, "credential_denied", env_var=var_name, agent=agent, granted=False)
+                    self._json_response(403, {"error": f"Access to {var_name} not permitted",
+                                               "hint": f"Add \"{var_name}\" to allowed list in {PERMISSIONS_FILE}"})
+                else:
+                    _log_access(base_dir, "credential_not_found", env_var=var_name, agent=agent, granted=False)
+                    self._json_response(404, {"error": f"{var_name} not found in .env"})
                 return
 
             # Enforce scoped limits (atomic check+record to avoid race)
-            scope = permissions.get("scopes", {}).get(var_name)
+            scope = snap["scopes"].get(var_name)
             if scope:
                 # RPM check first (does not mutate scope)
                 if tracker and scope.rpm_limit:
                     rpm_err = tracker.check_rpm(var_name, scope.rpm_limit)
                     if rpm_err:
                         _log_access(base_dir, "rpm_denied", env_var=var_name, agent=agent, granted=False)
-                        _send_alert(rpm_err, webhook=permissions.get("alerts", {}).get("webhook", ""),
-                                    key=var_name, agent=agent)
+                        _send_alert(rpm_err, webhook=snap["webhook"], key=var_name, agent=agent)
                         self._json_response(429, {"error": rpm_err})
                         return
                 # Use atomic check_and_record if available, else fallback
@@ -500,7 +1058,18 @@ def _make_handler(token: str, env_vars: dict[str, str], permissions: dict, base_
                 tracker.record_request(var_name, agent=agent)
 
             _log_access(base_dir, "credential_granted", env_var=var_name, agent=agent, granted=True)
-            self._json_response(200, {"env_var": var_name, "value": env_vars[var_name]})
+            self._send_json(200, grant_body)
+
+        def do_POST(self):
+            if not self._check_auth():
+                return
+            path = self.path
+            if path == "/usage":
+                self._post_usage(self._get_agent_id())
+            elif path.startswith(_CRED_PREFIX):
+                self._post_credential(path[_CRED_PREFIX_LEN:], self._get_agent_id())
+            else:
+                self.send_error(404)
 
     return Handler
 
@@ -518,7 +1087,20 @@ def create_permissions_template(base_dir: Path) -> Path:
     return p
 
 
-def serve(env_path: Path, port: int = DEFAULT_PORT, quiet: bool = False):
+def _warm_providers() -> None:
+    """Import and discover providers; runs off the main thread at startup."""
+    try:
+        from credential_auditor.providers import discover_providers
+    except ImportError:
+        return
+    discover_providers()
+
+
+def serve(env_path: Path, port: int = DEFAULT_PORT, quiet: bool = False, workers: int = 1):
+    # The provider import chain (httpx etc.) is the slowest part of startup;
+    # start it now so it overlaps .env/permissions loading and the banner.
+    # _make_handler's own import then waits on the import lock, not disk.
+    threading.Thread(target=_warm_providers, name="agent-provider-warmup", daemon=True).start()
     base_dir = env_path.parent
     env_vars = _load_env(env_path)
     if not env_vars:
@@ -549,7 +1131,10 @@ def serve(env_path: Path, port: int = DEFAULT_PORT, quiet: bool = False):
     if token_ttl:
         print(f"\033[36m  Token expires in:\033[0m  {int(token_ttl)}s")
     print(f"\033[36m  Usage tracking:\033[0m    enabled")
+    workers = max(1, min(workers, os.cpu_count() or 1))
     print(f"\033[36m  Listening on:\033[0m      http://127.0.0.1:{port}")
+    if workers > 1:
+        print(f"\033[36m  Listeners:\033[0m         {workers} (SO_REUSEPORT)")
     if quiet:
         # Avoid printing the bearer token into terminal scrollback (L-3)
         token_file = base_dir / ".check_please_agent_token"
@@ -569,16 +1154,19 @@ def serve(env_path: Path, port: int = DEFAULT_PORT, quiet: bool = False):
     print(f"  curl -H 'Authorization: Bearer {tok_hint}' http://127.0.0.1:{port}/usage")
     print(f"\n\033[2m  Press Ctrl+C to stop\033[0m\n")
 
-    handler = _make_handler(token, env_vars, permissions, base_dir, token_expires, tracker)
-    from http.server import ThreadingHTTPServer
-
-    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
-    server.daemon_threads = True
+    handler = _make_handler(token, env_vars, permissions, base_dir, token_expires, tracker,
+                            env_path=env_path)
+    servers = _bind_servers(port, handler, workers)
+    for extra in servers[1:]:
+        threading.Thread(target=extra.serve_forever, daemon=True).start()
     try:
-        server.serve_forever()
+        servers[0].serve_forever()
     except KeyboardInterrupt:
         print("\n\033[36m▸ Agent API stopped\033[0m")
-        server.server_close()
+        for extra in servers[1:]:
+            extra.shutdown()
+        for server in servers:
+            server.server_close()
 
 
 def _get_allowed_creds(env_path: Path, *, record_uses: bool = False) -> dict[str, str]:
@@ -596,10 +1184,12 @@ def _get_allowed_creds(env_path: Path, *, record_uses: bool = False) -> dict[str
         print(f"  Created {PERMISSIONS_FILE} — edit it to allow credentials.\n", file=sys.stderr)
         return {}
     result = {}
-    for k, v in env_vars.items():
-        if k not in permissions["allowed"]:
+    # Walk the allow-list (usually far shorter than .env); scopes holds
+    # exactly one entry per allowed name, in permissions-file order
+    for k, scope in permissions["scopes"].items():
+        v = env_vars.get(k)
+        if v is None:
             continue
-        scope = permissions.get("scopes", {}).get(k)
         if scope:
             if scope.check():
                 continue  # expired or exhausted
@@ -611,7 +1201,13 @@ def _get_allowed_creds(env_path: Path, *, record_uses: bool = False) -> dict[str
 
 # ── Mode: --env CMD (launch agent with credentials as env vars) ──
 
-def run_with_env(env_path: Path, cmd: list[str]):
+def run_with_env(env_path: Path, cmd: list[str], keep_parent: bool = False):
+    """Run *cmd* with the allowed credentials added to the environment.
+
+    On POSIX the broker execs into *cmd*, so no Python parent lingers;
+    keep_parent (or Windows, where exec spawns a detached child) waits on a
+    subprocess instead.
+    """
     creds = _get_allowed_creds(env_path, record_uses=True)
     if not creds:
         print("\033[31m✗ No allowed credentials to inject\033[0m", file=sys.stderr)
@@ -624,7 +1220,18 @@ def run_with_env(env_path: Path, cmd: list[str]):
     n = len(creds)
     print(f"\033[36m▸ Injecting {n} credential{'s' if n != 1 else ''} into: {' '.join(cmd)}\033[0m",
           file=sys.stderr)
-    sys.exit(subprocess.call(cmd, env=env))
+    if keep_parent or os.name == "nt":
+        sys.exit(subprocess.call(cmd, env=env))
+    # exec skips atexit handlers: drain the access log and stdio first. The
+    # log fds are non-inheritable, so the command doesn't keep them open.
+    _flush_logs()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        os.execvpe(cmd[0], cmd, env)
+    except OSError as exc:
+        print(f"\033[31m✗ Cannot run {cmd[0]}: {exc.strerror}\033[0m", file=sys.stderr)
+        sys.exit(127)
 
 
 # ── Mode: --export (print shell export statements) ──
@@ -661,33 +1268,60 @@ def run_mcp(env_path: Path):
     base_dir = env_path.parent
     permissions = _load_permissions(base_dir)
     tracker = _UsageTracker(base_dir)
+    scopes = permissions["scopes"]
+    webhook = permissions["alerts"].get("webhook", "")
+    token_threshold = permissions["alerts"].get("token_threshold", 0)
+
+    out = sys.stdout.buffer
+
+    def _send(msg: dict) -> None:
+        # Header and body in one write; Content-Length counts bytes
+        body = _dumps(msg)
+        out.write(b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
+        out.flush()
 
     def _respond(id, result):
-        msg = {"jsonrpc": "2.0", "id": id, "result": result}
-        body = json.dumps(msg)
-        sys.stdout.write(f"Content-Length: {len(body)}\r\n\r\n{body}")
-        sys.stdout.flush()
+        _send({"jsonrpc": "2.0", "id": id, "result": result})
 
     def _error(id, code, message):
-        msg = {"jsonrpc": "2.0", "id": id, "error": {"code": code, "message": message}}
-        body = json.dumps(msg)
-        sys.stdout.write(f"Content-Length: {len(body)}\r\n\r\n{body}")
-        sys.stdout.flush()
+        _send({"jsonrpc": "2.0", "id": id, "error": {"code": code, "message": message}})
+
+    def _frames():
+        """Yield each Content-Length framed message from stdin, parsed.
 
-    def _read_message() -> Optional[dict]:
-        # Read Content-Length header
+        Reads whatever is available into one buffer and cuts frames out of
+        it, instead of a readline per header line plus a read per body.
+        """
+        stdin = sys.stdin.buffer
+        buf = bytearray()
         while True:
-            line = sys.stdin.readline()
-            if not line:
-                return None
-            line = line.strip()
-            if line.startswith("Content-Length:"):
-                length = int(line.split(":", 1)[1].strip())
-                sys.stdin.readline()  # empty line
-                body = sys.stdin.read(length)
-                return json.loads(body)
-            if line == "":
+            crlf, lf = buf.find(b"\r\n\r\n"), buf.find(b"\n\n")
+            if crlf < 0 and lf < 0:
+                chunk = stdin.read1(65536)
+                if not chunk:
+                    return
+                buf += chunk
+                continue
+            if lf < 0 or 0 <= crlf < lf:
+                end, start = crlf, crlf + 4
+            else:
+                end, start = lf, lf + 2
+            length = None
+            for line in bytes(buf[:end]).splitlines():
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    length = int(value)
+            if length is None:
+                del buf[:start]  # stray blank lines / unknown headers
                 continue
+            while len(buf) < start + length:
+                chunk = stdin.read1(65536)
+                if not chunk:
+                    return
+                buf += chunk
+            body = bytes(buf[start:start + length])
+            del buf[:start + length]
+            yield _loads(body)
 
     tools = [
         {
@@ -721,13 +1355,73 @@ def run_mcp(env_path: Path):
         },
     ]
 
-    print("check_please MCP credential server ready", file=sys.stderr)
+    # creds is fixed for the session, so the list_credentials reply is too
+    list_result = {"content": [{"type": "text", "text": json.dumps(list(creds))}]}
 
-    while True:
-        msg = _read_message()
-        if msg is None:
-            break
+    def _tool_error(id, text: str):
+        _respond(id, {"content": [{"type": "text", "text": text}], "isError": True})
 
+    def _list_credentials(id, args: dict):
+        _log_access(base_dir, "mcp_list", granted=True)
+        _respond(id, list_result)
+
+    def _get_credential(id, args: dict):
+        var = args.get("name", "")
+        if var not in creds:
+            _log_access(base_dir, "mcp_denied", env_var=var, granted=False)
+            _tool_error(id, f"Access denied: {var}")
+            return
+        scope = scopes.get(var)
+        if scope:
+            err = scope.check()
+            if err:
+                _log_access(base_dir, "mcp_scope_denied", env_var=var, granted=False)
+                _tool_error(id, err)
+                return
+            if scope.rpm_limit:
+                rpm_err = tracker.check_rpm(var, scope.rpm_limit)
+                if rpm_err:
+                    _log_access(base_dir, "mcp_rpm_denied", env_var=var, granted=False)
+                    _send_alert(rpm_err, webhook=webhook, key=var)
+                    _tool_error(id, rpm_err)
+                    return
+            scope.record_use()
+        tracker.record_request(var)
+        _log_access(base_dir, "mcp_get", env_var=var, granted=True)
+        _respond(id, {"content": [{"type": "text", "text": creds[var]}]})
+
+    def _report_usage(id, args: dict):
+        key = args.get("key", "")
+        try:
+            tokens = int(args.get("tokens", 0))
+        except (TypeError, ValueError):
+            _error(id, -32602, "tokens must be an integer")
+            return
+        if tokens < 0 or tokens > 1_000_000_000:
+            _error(id, -32602, "tokens out of range")
+            return
+        model = args.get("model", "")
+        if not isinstance(model, str):
+            model = str(model)
+        if key and tokens > 0:
+            total = tracker.record_tokens(key, tokens, model=model)
+            # Alert once, on the report that crosses the threshold
+            if token_threshold and total - tokens < token_threshold <= total:
+                _send_alert(f"{key} exceeded {token_threshold} tokens",
+                            webhook=webhook, key=key)
+        _log_access(base_dir, "mcp_usage_report", env_var=key, granted=True)
+        _respond(id, {"content": [{"type": "text", "text": "usage recorded"}]})
+
+    # tools/call dispatch; keys match the names advertised in `tools`
+    tool_handlers = {
+        "get_credential": _get_credential,
+        "list_credentials": _list_credentials,
+        "report_usage": _report_usage,
+    }
+
+    print("check_please MCP credential server ready", file=sys.stderr)
+
+    for msg in _frames():
         method = msg.get("method", "")
         id = msg.get("id")
         params = msg.get("params", {})
@@ -744,60 +1438,11 @@ def run_mcp(env_path: Path):
             _respond(id, {"tools": tools})
         elif method == "tools/call":
             tool_name = params.get("name", "")
-            args = params.get("arguments", {})
-            if tool_name == "list_credentials":
-                names = list(creds.keys())
-                _log_access(base_dir, "mcp_list", granted=True)
-                _respond(id, {"content": [{"type": "text", "text": json.dumps(names)}]})
-            elif tool_name == "get_credential":
-                var = args.get("name", "")
-                if var in creds:
-                    scope = permissions.get("scopes", {}).get(var)
-                    if scope:
-                        err = scope.check()
-                        if err:
-                            _log_access(base_dir, "mcp_scope_denied", env_var=var, granted=False)
-                            _respond(id, {"content": [{"type": "text", "text": err}], "isError": True})
-                            continue
-                        if scope.rpm_limit:
-                            rpm_err = tracker.check_rpm(var, scope.rpm_limit)
-                            if rpm_err:
-                                _log_access(base_dir, "mcp_rpm_denied", env_var=var, granted=False)
-                                _send_alert(rpm_err, webhook=permissions.get("alerts", {}).get("webhook", ""),
-                                            key=var)
-                                _respond(id, {"content": [{"type": "text", "text": rpm_err}], "isError": True})
-                                continue
-                        scope.record_use()
-                    tracker.record_request(var)
-                    _log_access(base_dir, "mcp_get", env_var=var, granted=True)
-                    _respond(id, {"content": [{"type": "text", "text": creds[var]}]})
-                else:
-                    _log_access(base_dir, "mcp_denied", env_var=var, granted=False)
-                    _respond(id, {"content": [{"type": "text", "text": f"Access denied: {var}"}], "isError": True})
-            elif tool_name == "report_usage":
-                key = args.get("key", "")
-                try:
-                    tokens = int(args.get("tokens", 0))
-                except (TypeError, ValueError):
-                    _error(id, -32602, "tokens must be an integer")
-                    continue
-                if tokens < 0 or tokens > 1_000_000_000:
-                    _error(id, -32602, "tokens out of range")
-                    continue
-                model = args.get("model", "")
-                if not isinstance(model, str):
-                    model = str(model)
-                if key and tokens > 0:
-                    tracker.record_tokens(key, tokens, model=model)
-                    alerts = permissions.get("alerts", {})
-                    token_threshold = alerts.get("token_threshold", 0)
-                    if token_threshold and tracker.summary(key).get("tokens", 0) >= token_threshold:
-                        _send_alert(f"{key} exceeded {token_threshold} tokens",
-                                    webhook=alerts.get("webhook", ""), key=key)
-                _log_access(base_dir, "mcp_usage_report", env_var=key, granted=True)
-                _respond(id, {"content": [{"type": "text", "text": "usage recorded"}]})
-            else:
+            handler = tool_handlers.get(tool_name)
+            if handler is None:
                 _error(id, -32601, f"Unknown tool: {tool_name}")
+            else:
+                handler(id, params.get("arguments", {}))
         elif method == "ping":
             _respond(id, {})
         else:
@@ -809,17 +1454,25 @@ if __name__ == "__main__":
     args = sys.argv[1:]
     env_path = Path(".env")
     quiet = False
+    workers = 1
 
-    # Parse --env-file / --quiet before mode flags
+    # Parse --env-file / --quiet / --workers before mode flags. --env's
+    # command is passed through untouched, so stop scanning once we reach it.
     cleaned: list[str] = []
     i = 0
     while i < len(args):
+        if args[i] in ("--env", "--"):
+            cleaned.extend(args[i:])
+            break
         if args[i] == "--env-file" and i + 1 < len(args):
             env_path = Path(args[i + 1])
             i += 2
         elif args[i] == "--quiet":
             quiet = True
             i += 1
+        elif args[i] == "--workers" and i + 1 < len(args) and args[i + 1].isdigit():
+            workers = int(args[i + 1])
+            i += 2
         else:
             cleaned.append(args[i])
             i += 1
@@ -829,7 +1482,7 @@ if __name__ == "__main__":
         port = DEFAULT_PORT
         if len(args) > 1 and args[-1].isdigit():
             port = int(args[-1])
-        serve(env_path, port, quiet=quiet)
+        serve(env_path, port, quiet=quiet, workers=workers)
     elif args[0] == "--export":
         print_exports(env_path)
     elif args[0] == "--write-env":
@@ -840,16 +1493,19 @@ if __name__ == "__main__":
     elif args[0] == "--mcp":
         run_mcp(env_path)
     elif args[0] == "--env":
-        if len(args) < 2:
-            print("Usage: agent_api.py --env COMMAND [ARGS...]", file=sys.stderr)
+        keep_parent = len(args) > 1 and args[1] == "--keep-parent"
+        cmd = args[2:] if keep_parent else args[1:]
+        if not cmd:
+            print("Usage: agent_api.py --env [--keep-parent] COMMAND [ARGS...]", file=sys.stderr)
             sys.exit(2)
-        run_with_env(env_path, args[1:])
+        run_with_env(env_path, cmd, keep_parent=keep_parent)
     else:
         print(f"""Usage: agent_api.py [MODE] [OPTIONS]
 
 Modes:
   --serve            HTTP credential broker (default)
-  --env CMD...       Launch CMD with allowed credentials as env vars
+  --env CMD...       Launch CMD with allowed credentials as env vars (execs
+                     into CMD; add --keep-parent before CMD to run it as a child)
   --export           Print shell export statements (use with eval)
   --write-env PATH   Write credentials to a file in KEY=VALUE format
   --mcp              MCP stdio server for Claude Code, Copilot, etc.
@@ -857,5 +1513,6 @@ Modes:
 Options:
   --env-file PATH  Path to .env file (default: .env)
   --quiet          Write bearer token to .check_please_agent_token instead of printing it
+  --workers N      Accept on N SO_REUSEPORT listeners (--serve only, default 1)
 """, file=sys.stderr)
         sys.exit(2)
@@ -10,27 +10,38 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import asyncio
 import sys
 from pathlib import Path
 
 from rich.console import Console
 
-from credential_auditor.providers import Provider, discover_providers
+# asyncio and credential_auditor.providers (httpx + every provider module) are
+# imported where needed, so --version / --completion / --help start fast
 
 
-def _build_parser() -> argparse.ArgumentParser:
-    discover_providers()
-    available = sorted(Provider.get_registry().keys())
+class _Parser(argparse.ArgumentParser):
+    """ArgumentParser that discovers providers only when help is rendered."""
+
+    def format_help(self) -> str:
+        from credential_auditor.providers import Provider, discover_providers
+
+        discover_providers()
+        available = ", ".join(sorted(Provider.get_registry()))
+        for action in self._actions:
+            if action.dest == "providers":
+                action.help = f"Provider to check (repeatable). Available: {available}"
+        return super().format_help()
 
-    p = argparse.ArgumentParser(
+
+def _build_parser() -> argparse.ArgumentParser:
+    p = _Parser(
         prog="credential_auditor",
         description="Credential auditing tool — validates API keys against live provider endpoints.",
     )
     p.add_argument("--env", type=Path, help="Path to .env file")
     p.add_argument(
         "--provider", action="append", dest="providers", metavar="NAME",
-        help=f"Provider to check (repeatable). Available: {', '.join(available)}",
+        help="Provider to check (repeatable)",
     )
     p.add_argument("--output", type=Path, help="Write JSON results to file")
     p.add_argument("--json", action="store_true", help="Print JSON results to stdout")
@@ -123,6 +134,7 @@ def main() -> int:
         return 0
 
     if args.list_providers:
+        from credential_auditor.providers import Provider, discover_providers
         discover_providers()
         reg = Provider.get_registry()
         from rich.table import Table
@@ -138,6 +150,8 @@ def main() -> int:
         return 0
 
     if args.self_test:
+        import asyncio
+
         from credential_auditor.self_test import run_self_test
         ok = asyncio.run(run_self_test(console))
         return 0 if ok else 1
@@ -156,12 +170,16 @@ def main() -> int:
 
     # Dry run — show matched credentials without API calls
     if args.dry_run:
-        from dotenv import dotenv_values
-        from credential_auditor.providers import detect_provider_by_key
+        from credential_auditor.envfile import read_env
+        from credential_auditor.providers import (
+            Provider, detect_provider_by_key, discover_providers, env_var_matcher,
+        )
         discover_providers()
         reg = Provider.get_registry()
-        active = {n: cls() for n, cls in reg.items()} if not args.providers else {n: reg[n]() for n in args.providers if n in reg}
-        env_vars = dotenv_values(args.env)
+        # Classes suffice: matches_env_var is a classmethod
+        active = reg if not args.providers else {n: reg[n] for n in args.providers if n in reg}
+        match_env = env_var_matcher(active)
+        env_vars = read_env(args.env)
         from rich.table import Table
         t = Table(title="Dry Run — Credentials to Audit", show_lines=True)
         t.add_column("Env Var", style="cyan")
@@ -172,11 +190,10 @@ def main() -> int:
         for var, val in env_vars.items():
             if not var or not val: continue
             matched = None
-            for name, inst in active.items():
-                if inst.matches_env_var(var):
-                    matched = (name, "env_var")
-                    break
-            if not matched:
+            name = match_env(var)
+            if name:
+                matched = (name, "env_var")
+            else:
                 det = detect_provider_by_key(str(val))
                 if det and det.name in active:
                     matched = (det.name, "key_pattern")
@@ -189,6 +206,8 @@ def main() -> int:
         console.print(f"\n[bold]{count}[/bold] credentials would be audited.")
         return 0
 
+    import asyncio
+
     from credential_auditor.orchestrator import audit
     from credential_auditor.output import render_table, write_json
 
@@ -238,11 +257,11 @@ def main() -> int:
 
     # JSON to stdout
     if args.json:
-        import json
+        from credential_auditor.jsonio import dumps
         payload: list[dict] | dict = [r.to_dict(rl) for r in results]
         if summary:
             payload = {"summary": summary.to_dict(), "results": payload}
-        print(json.dumps(payload, indent=2, ensure_ascii=False))
+        print(dumps(payload, indent=True).decode())
 
     # JSON to file
     if args.output:
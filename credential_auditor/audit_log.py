@@ -7,7 +7,6 @@ Enhanced for God-tier: JSON structured logs, correlation IDs, context propagatio
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import sys
@@ -16,6 +15,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+from credential_auditor.jsonio import dumps
+
 # Correlation ID context variable — propagates across async/await without explicit threading
 _correlation_id: ContextVar[str] = ContextVar("correlation_id", default="")
 
@@ -28,6 +29,9 @@ if not _struct_logger.handlers:
     _struct_logger.setLevel(logging.INFO)
 
 
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
 def get_correlation_id() -> str:
     """Return current correlation ID or generate a new one."""
     cid = _correlation_id.get()
@@ -51,7 +55,15 @@ class AuditLog:
 
     def __init__(self, path: Path):
         self.path = path
-        self._entries: list[dict[str, Any]] = []
+        # Entries are kept as their encoded JSON lines: one compact bytes object
+        # each instead of a ~6-key dict, and flush() has nothing left to encode
+        self._lines: list[bytes] = []
+        # Running size of the file, seeded once here and advanced by flush(),
+        # so rotation checks don't stat the file on every flush
+        try:
+            self._size = path.stat().st_size
+        except OSError:
+            self._size = 0
 
     def log(
         self,
@@ -80,35 +92,45 @@ class AuditLog:
             entry["detail"] = detail
         if extra:
             entry.update(extra)
-        self._entries.append(entry)
+        try:
+            line = dumps(entry)
+        except (TypeError, ValueError):
+            # Logging must never crash the program; stringify unserializable values
+            line = dumps({k: v if isinstance(v, _JSON_SCALARS) else str(v) for k, v in entry.items()})
+        self._lines.append(line + b"\n")
 
         # Emit structured log line for observability (stdout)
         try:
-            _struct_logger.info(json.dumps(entry, ensure_ascii=False))
-        except (TypeError, ValueError, OSError):
-            # Logging must never crash the program; swallow serialization errors
+            _struct_logger.info(line.decode())
+        except OSError:
             pass
 
     def flush(self) -> None:
         """Append buffered entries to log file, rotating if oversized."""
-        if not self._entries:
+        if not self._lines:
             return
         # Refuse to write through symlinks
         if self.path.is_symlink():
-            self._entries.clear()
+            self._lines.clear()
             return
-        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not self._size:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
         # Rotate if log exceeds max size
-        if self.path.exists() and self.path.stat().st_size > self.MAX_SIZE:
+        if self._size > self.MAX_SIZE:
             rotated = self.path.with_suffix(".log.1")
             if rotated.exists():
                 rotated.unlink()
-            self.path.rename(rotated)
-        with self.path.open("a") as f:
-            for entry in self._entries:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
-        self._entries.clear()
+            try:
+                self.path.rename(rotated)
+            except FileNotFoundError:
+                pass  # removed behind our back; nothing to rotate
+            self._size = 0
+        data = b"".join(self._lines)
+        with self.path.open("ab") as f:
+            f.write(data)
+        self._size += len(data)
+        self._lines.clear()
 
     @property
     def entry_count(self) -> int:
-        return len(self._entries)
+        return len(self._lines)
@@ -9,15 +9,31 @@ from __future__ import annotations
 import hashlib
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Sequence
 
 from credential_auditor.models import KeyResult
 
 
-def _cache_key(provider: str, key: str) -> str:
-    """Hash provider+key for cache lookup (never stores raw key)."""
-    return hashlib.sha256(f"{provider}:{key}".encode()).hexdigest()[:16]
+try:
+    from blake3 import blake3 as _blake3  # optional: SIMD hash, installed with the fast extra
+except ImportError:  # pragma: no cover - exercised when blake3 is absent
+    _blake3 = None
+
+
+def cache_key(provider: str, key: str) -> str:
+    """Hash provider+key for cache lookup (never stores raw key).
+
+    Callers that both get() and put() the same pair can hash once and pass
+    the result as ``ck=`` to each. Digests only live in this process, so the
+    hash function can differ between installs.
+    """
+    data = f"{provider}:{key}".encode()
+    if _blake3 is not None:
+        return _blake3(data).hexdigest(length=8)
+    # BLAKE2b with an 8-byte digest: stdlib, and cheaper than truncated SHA-256
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
 
 
 @dataclass
@@ -38,33 +54,58 @@ class CacheStats:
 
 
 class ValidationCache:
-    """In-memory TTL cache for KeyResult objects with size limit."""
+    """In-memory TTL cache for KeyResult objects with LRU eviction at max_size."""
 
     def __init__(self, ttl_seconds: int = 3600, max_size: int = 10_000):
         self.ttl = ttl_seconds
         self.max_size = max_size
-        self._store: dict[str, tuple[KeyResult, float]] = {}
+        # Least recently used first: hits and puts move an entry to the end
+        self._store: OrderedDict[str, tuple[KeyResult, float]] = OrderedDict()
         self.stats = CacheStats()
         self._lock = threading.Lock()
 
-    def get(self, provider: str, key: str) -> Optional[KeyResult]:
-        ck = _cache_key(provider, key)
+    def get(self, provider: str, key: str, ck: Optional[str] = None) -> Optional[KeyResult]:
+        ck = ck or cache_key(provider, key)
         with self._lock:
             entry = self._store.get(ck)
             if entry and (time.monotonic() - entry[1]) < self.ttl:
                 self.stats.hits += 1
+                self._store.move_to_end(ck)
                 return entry[0]
             if entry:
                 del self._store[ck]
             self.stats.misses += 1
             return None
 
-    def put(self, provider: str, key: str, result: KeyResult) -> None:
+    def bulk_get(self, cks: Sequence[str]) -> list[Optional[KeyResult]]:
+        """get() for many pre-hashed keys under one lock; None marks a miss."""
+        now = time.monotonic()
+        ttl = self.ttl
+        store = self._store
+        out: list[Optional[KeyResult]] = []
+        with self._lock:
+            for ck in cks:
+                entry = store.get(ck)
+                if entry and (now - entry[1]) < ttl:
+                    store.move_to_end(ck)
+                    out.append(entry[0])
+                    continue
+                if entry:
+                    del store[ck]
+                out.append(None)
+            hits = sum(r is not None for r in out)
+            self.stats.hits += hits
+            self.stats.misses += len(out) - hits
+        return out
+
+    def put(self, provider: str, key: str, result: KeyResult, ck: Optional[str] = None) -> None:
+        ck = ck or cache_key(provider, key)
         with self._lock:
-            if len(self._store) >= self.max_size:
-                oldest = min(self._store, key=lambda k: self._store[k][1])
-                del self._store[oldest]
-            self._store[_cache_key(provider, key)] = (result, time.monotonic())
+            if ck in self._store:
+                self._store.move_to_end(ck)
+            elif len(self._store) >= self.max_size:
+                self._store.popitem(last=False)
+            self._store[ck] = (result, time.monotonic())
 
     def clear(self) -> None:
         with self._lock:
@@ -0,0 +1,62 @@
+""".env reading with a fast path for plain KEY=value files.
+
+Most credential files are nothing but ``KEY=value`` lines, which a single
+str.partition per line parses far faster than python-dotenv's tokenizer.
+Anything beyond that — escapes (in either quote style), ``${VAR}``
+interpolation, inline comments, multiline values — sends the whole file to
+python-dotenv. Lines the fast path does accept parse as ``dotenv_values``
+would.
+"""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import Optional
+
+
+def parse_simple(text: str) -> Optional[dict[str, Optional[str]]]:
+    """Parse *text* if every line is plain; return None if dotenv is needed.
+
+    Handles comments, blank lines, ``export`` prefixes and values wrapped in
+    one pair of quotes.
+    """
+    out: dict[str, Optional[str]] = {}  # same value type as dotenv_values
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] == "#":
+            continue
+        if line.startswith("export "):
+            line = line[7:].lstrip()
+        key, eq, value = line.partition("=")
+        key = key.rstrip()
+        if not eq or not key or any(c.isspace() or c in "#'\"" for c in key):
+            return None
+        value = value.strip()
+        quote = value[:1]
+        if quote == "'" or quote == '"':
+            inner = value[1:-1]
+            if len(value) < 2 or value[-1] != quote or quote in inner:
+                return None
+            # dotenv decodes escapes inside both quote styles, and ${VAR} in "..."
+            if "\\" in inner or (quote == '"' and "$" in inner):
+                return None
+            value = inner
+        elif "$" in value or "\\" in value or "#" in value or "'" in value or '"' in value:
+            return None
+        out[key] = value
+    return out
+
+
+def read_env(path: Path | str) -> dict[str, Optional[str]]:
+    """Drop-in for ``dotenv_values(path)``: {} for a missing file, dotenv for complex syntax."""
+    try:
+        text = Path(path).read_text(encoding="utf-8")
+    except (FileNotFoundError, IsADirectoryError):
+        return {}
+    env = parse_simple(text)
+    if env is not None:
+        return env
+    from dotenv import dotenv_values
+
+    return dotenv_values(stream=io.StringIO(text))
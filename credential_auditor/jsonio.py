@@ -0,0 +1,36 @@
+"""JSON encode/decode helpers — orjson when installed, stdlib json otherwise.
+
+Install the ``fast`` extra (``pip install check-please[fast]``) to get orjson.
+Both backends produce UTF-8 bytes with non-ASCII characters unescaped, so
+output is interchangeable with ``json.dumps(..., ensure_ascii=False)``.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson  # optional: C serializer, returns bytes directly
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
+
+if orjson is not None:
+    _OPTS = orjson.OPT_NON_STR_KEYS  # json.dumps coerces int/float keys too
+    _INDENT_OPTS = _OPTS | orjson.OPT_INDENT_2
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize *obj* to compact (or 2-space indented) UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=_INDENT_OPTS if indent else _OPTS)
+
+    loads = orjson.loads
+else:
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize *obj* to compact (or 2-space indented) UTF-8 JSON bytes."""
+        if indent:
+            return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    loads = json.loads
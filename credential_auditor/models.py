@@ -2,7 +2,7 @@
 
 Design sources:
 - Status as Literal (Qwen) — type-checker catches typos
-- frozen dataclass (Claude/GPT) — immutable results
+- frozen, slotted dataclass (Claude/GPT) — immutable results, no per-instance __dict__
 - Canonical field ordering via to_dict() (DeepSeek) — stable JSON (INV-5)
 """
 
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass, field
+from hashlib import sha256
 from typing import Any, Literal, Optional
 
 Status = Literal[
@@ -29,7 +30,7 @@ FAILING_STATUSES: frozenset[str] = frozenset(
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KeyFingerprint:
     prefix: str
     suffix: str
@@ -38,12 +39,12 @@ class KeyFingerprint:
 
     @classmethod
     def from_key(cls, key: str) -> "KeyFingerprint":
-        import hashlib
+        n = len(key)
         return cls(
-            prefix=key[:4] if len(key) >= 4 else key,
-            suffix=key[-4:] if len(key) >= 4 else "",
-            length=len(key),
-            key_hash=hashlib.sha256(key.encode()).hexdigest()[:16],
+            prefix=key[:4],  # slicing past the end yields the whole (short) key
+            suffix=key[-4:] if n >= 4 else "",
+            length=n,
+            key_hash=sha256(key.encode()).hexdigest()[:16],
         )
 
     def to_dict(self, redaction_level: str = "partial") -> dict[str, Any]:
@@ -55,7 +56,7 @@ class KeyFingerprint:
         return {"prefix": self.prefix, "suffix": self.suffix, "length": self.length}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RateLimitInfo:
     limit: int
     remaining: int
@@ -65,7 +66,7 @@ class RateLimitInfo:
         return {"limit": self.limit, "remaining": self.remaining, "reset_ts": self.reset_ts}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KeyResult:
     """Immutable audit result with canonical 10-field ordering."""
 
@@ -82,7 +83,10 @@ class KeyResult:
     auto_detected: bool = False
 
     def to_dict(self, redaction_level: str = "partial") -> dict[str, Any]:
-        """Canonical field ordering per spec — INV-5."""
+        """Canonical field ordering per spec — INV-5.
+
+        latency_ms is emitted as stored; check_key rounds it to 0.01 ms.
+        """
         return {
             "provider": self.provider,
             "env_var": self.env_var,
@@ -92,13 +96,13 @@ class KeyResult:
             "scopes": self.scopes,
             "rate_limit": self.rate_limit.to_dict() if self.rate_limit else None,
             "usage_stats": self.usage_stats,
-            "latency_ms": round(self.latency_ms, 2),
+            "latency_ms": self.latency_ms,
             "error_detail": self.error_detail,
             "auto_detected": self.auto_detected,
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuditSummary:
     """Aggregate stats for an audit run — ported from ultimate_credential_auditor."""
 
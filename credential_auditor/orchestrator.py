@@ -1,8 +1,8 @@
 """Async orchestration engine with cache, audit log, auto-detect, and failed-provider bail.
 
 Design sources:
-- asyncio.gather(return_exceptions=True) (all Tier 1-2 variants)
-- Two-layer error defense: gather catches + per-provider try/except in check_key (Claude)
+- Bounded worker pool; each worker captures exceptions per key (all Tier 1-2 variants)
+- Two-layer error defense: worker catches + per-provider try/except in check_key (Claude)
 - Context manager for httpx client lifecycle (Claude)
 - Sort results for stable output (DeepSeek)
 
@@ -16,25 +16,32 @@ Enhanced with features ported from ultimate_credential_auditor:
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import os
 import time
 from dataclasses import replace
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Optional
 
 import httpx
-from dotenv import dotenv_values
 from rich.console import Console
 
 from credential_auditor.audit_log import AuditLog, get_correlation_id, set_correlation_id
-from credential_auditor.cache import ValidationCache
+from credential_auditor.cache import ValidationCache, cache_key
+from credential_auditor.envfile import read_env
 from credential_auditor.models import (
     AuditSummary,
     FAILING_STATUSES,
     KeyFingerprint,
     KeyResult,
 )
-from credential_auditor.providers import Provider, detect_provider_by_key, discover_providers
+from credential_auditor.providers import (
+    Provider,
+    detect_provider_by_key,
+    discover_providers,
+    env_var_matcher,
+)
 from credential_auditor.security import suppress_credential_logging
 
 # Module-level cache persists across audit runs within the same process
@@ -46,6 +53,10 @@ _FAIL_BAIL_THRESHOLD = 3
 # Limit concurrent outbound requests to avoid triggering provider rate limits
 _CONCURRENCY_LIMIT = 10
 
+# httpx raises at client construction when http2=True and h2 is missing, so
+# only ask for HTTP/2 when the optional dependency is importable
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
 # Circuit breaker state per provider: {provider: (failure_count, last_failure_ts, state)}
 # state: "closed" (normal), "open" (failing fast), "half_open" (testing recovery)
 _circuit_breakers: dict[str, tuple[int, float, str]] = {}
@@ -127,40 +138,31 @@ async def audit(
     else:
         active = {name: cls() for name, cls in registry.items()}
 
-    env_vars = dotenv_values(env_path)
+    env_vars = read_env(env_path)
 
     # Expose known companion vars (e.g. TWILIO_ACCOUNT_SID) so providers can read them.
     # Previously this injected all non-secret vars, which could leak DATABASE_URL etc.
     # Now restricted to explicit allowlist for security.
     # Save prior values so we can restore (never permanently clobber the process env).
-    _env_backup: dict[str, str | None] = {}
-
-    def _inject(var: str, value: str) -> None:
-        if var not in _env_backup:
-            _env_backup[var] = os.environ.get(var)
-        os.environ[var] = value
-
     _COMPANION_VARS = ("TWILIO_ACCOUNT_SID",)
-    for var in _COMPANION_VARS:
-        val = env_vars.get(var)
-        if val:
-            _inject(var, val)
+    companions = {var: val for var in _COMPANION_VARS if (val := env_vars.get(var))}
+    _env_backup: dict[str, str | None] = {var: os.environ.get(var) for var in companions}
+    os.environ.update(companions)
 
     # Match env vars to providers — with auto-detection fallback
     tasks: list[tuple[str, str, Provider]] = []
     auto_detected_count = 0
     auto_detected_vars: set[str] = set()
+    # One combined env_patterns regex for all active providers: a single match per var
+    match_provider = env_var_matcher({name: type(inst) for name, inst in active.items()})
     for var, value in env_vars.items():
         if not var or not value:
             continue
-        matched = False
-        for name, inst in active.items():
-            if inst.matches_env_var(var):
-                tasks.append((var, str(value), inst))
-                matched = True
-                break
+        owner = match_provider(var)
+        if owner is not None:
+            tasks.append((var, str(value), active[owner]))
         # Auto-detect by key pattern if no env var match
-        if not matched:
+        else:
             detected = detect_provider_by_key(str(value))
             if detected and detected.name in active:
                 tasks.append((var, str(value), detected))
@@ -185,69 +187,92 @@ async def audit(
         # Check cache first, separate cached vs uncached
         cached_results: list[KeyResult] = []
         uncached_tasks: list[tuple[str, str, Provider]] = []
-        for var, key, inst in tasks:
-            hit = _cache.get(inst.name, key)
+        uncached_cks: list[str] = []  # hashed once here, reused by _cache.put below
+        cks = [cache_key(inst.name, key) for _, key, inst in tasks]
+        for (var, key, inst), ck, hit in zip(tasks, cks, _cache.bulk_get(cks)):
             if hit:
                 hit = replace(hit, env_var=var, auto_detected=var in auto_detected_vars)
                 cached_results.append(hit)
                 alog.log("cache_hit", provider=inst.name, env_var=var, status=hit.status)
             else:
                 uncached_tasks.append((var, key, inst))
+                uncached_cks.append(ck)
 
         # Failed-provider tracking — bail mid-run so remaining keys for that provider are skipped
         fail_counts: dict[str, int] = {}
         skipped_providers: set[str] = set()
         bail_lock = asyncio.Lock()
 
-        sem = asyncio.Semaphore(_CONCURRENCY_LIMIT)
-
-        async def _throttled_check(inst: Provider, var: str, key: str, client: httpx.AsyncClient) -> KeyResult:
-            async with sem:
-                # Circuit breaker fast-fail
-                if not _should_allow_request(inst.name):
+        async def _guarded_check(inst: Provider, var: str, key: str, client: httpx.AsyncClient) -> KeyResult:
+            # Circuit breaker fast-fail
+            if not _should_allow_request(inst.name):
+                return KeyResult(
+                    provider=inst.name, env_var=var,
+                    key_fingerprint=KeyFingerprint.from_key(key),
+                    status="network_error",
+                    error_detail="circuit breaker open — provider temporarily disabled",
+                )
+            # Skip if this provider already bailed (checked under lock for consistency)
+            async with bail_lock:
+                if inst.name in skipped_providers:
                     return KeyResult(
                         provider=inst.name, env_var=var,
                         key_fingerprint=KeyFingerprint.from_key(key),
-                        status="network_error",
-                        error_detail="circuit breaker open — provider temporarily disabled",
+                        status="auth_failed",
+                        error_detail=f"skipped: provider bailed after {_FAIL_BAIL_THRESHOLD} consecutive failures",
                     )
-                # Skip if this provider already bailed (checked under lock for consistency)
-                async with bail_lock:
-                    if inst.name in skipped_providers:
-                        return KeyResult(
-                            provider=inst.name, env_var=var,
-                            key_fingerprint=KeyFingerprint.from_key(key),
-                            status="auth_failed",
-                            error_detail=f"skipped: provider bailed after {_FAIL_BAIL_THRESHOLD} consecutive failures",
-                        )
+            try:
                 result = await inst.check_key(var, key, client)
-                success = result.status == "valid"
-                _record_circuit_result(inst.name, success)
-                if result.status in FAILING_STATUSES:
-                    async with bail_lock:
-                        fail_counts[inst.name] = fail_counts.get(inst.name, 0) + 1
-                        if fail_counts[inst.name] >= _FAIL_BAIL_THRESHOLD:
-                            if inst.name not in skipped_providers:
-                                skipped_providers.add(inst.name)
-                                alog.log(
-                                    "provider_bail", provider=inst.name,
-                                    detail=f"skipped after {_FAIL_BAIL_THRESHOLD} consecutive failures",
-                                )
-                else:
-                    async with bail_lock:
-                        fail_counts[inst.name] = 0
-                return result
-
-        # God-tier: HTTP/2 + connection pooling + keep-alive for lower latency
-        limits = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0)
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            max_redirects=0,
-            limits=limits,
-            http2=True,  # requires httpx[http2] but falls back gracefully if not installed
-        ) as client:
-            coros = [_throttled_check(inst, var, key, client) for var, key, inst in uncached_tasks]
-            raw: list[KeyResult | BaseException] = await asyncio.gather(*coros, return_exceptions=True)
+            except Exception:
+                # A provider bug escapes check_key and becomes a network_error
+                # result in _worker; count it like one so the breaker still trips
+                _record_circuit_result(inst.name, False)
+                async with bail_lock:
+                    fail_counts[inst.name] = 0
+                raise
+            success = result.status == "valid"
+            _record_circuit_result(inst.name, success)
+            if result.status in FAILING_STATUSES:
+                async with bail_lock:
+                    fail_counts[inst.name] = fail_counts.get(inst.name, 0) + 1
+                    if fail_counts[inst.name] >= _FAIL_BAIL_THRESHOLD:
+                        if inst.name not in skipped_providers:
+                            skipped_providers.add(inst.name)
+                            alog.log(
+                                "provider_bail", provider=inst.name,
+                                detail=f"skipped after {_FAIL_BAIL_THRESHOLD} consecutive failures",
+                            )
+            else:
+                async with bail_lock:
+                    fail_counts[inst.name] = 0
+            return result
+
+        raw: list[KeyResult | BaseException] = []
+        # Fully cached run (repeat audits, TUI refresh): no network, so skip
+        # building the client and its connection pool entirely
+        if uncached_tasks:
+            # HTTP/2 (with the fast extra) + connection pooling + keep-alive for lower latency
+            limits = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0)
+            async with httpx.AsyncClient(
+                timeout=timeout,
+                max_redirects=0,
+                limits=limits,
+                http2=_HTTP2,
+            ) as client:
+                # A fixed pool of workers pulls from one shared iterator, so at most
+                # _CONCURRENCY_LIMIT checks (and tasks) exist however long the .env is
+                pending = iter(enumerate(uncached_tasks))
+                raw = [None] * len(uncached_tasks)  # type: ignore[list-item]
+
+                async def _worker() -> None:
+                    for i, (var, key, inst) in pending:
+                        try:
+                            raw[i] = await _guarded_check(inst, var, key, client)
+                        except Exception as exc:  # becomes a network_error result below
+                            raw[i] = exc
+
+                workers = min(_CONCURRENCY_LIMIT, len(uncached_tasks))
+                await asyncio.gather(*(_worker() for _ in range(workers)))
 
         results: list[KeyResult] = list(cached_results)
         for i, raw_result in enumerate(raw):
@@ -266,7 +291,7 @@ async def audit(
 
             # Only cache real network results (not bail-skips)
             if not (result.status == "auth_failed" and result.error_detail and result.error_detail.startswith("skipped:")):
-                _cache.put(inst.name, key, result)
+                _cache.put(inst.name, key, result, ck=uncached_cks[i])
 
             if var in auto_detected_vars:
                 result = replace(result, auto_detected=True)
@@ -274,13 +299,21 @@ async def audit(
                      status=result.status, latency_ms=result.latency_ms)
             results.append(result)
 
-        results.sort(key=lambda r: (r.provider, r.env_var))
-
-        # Build summary
-        valid_count = sum(1 for r in results if r.status == "valid")
-        fail_count = sum(1 for r in results if r.status in FAILING_STATUSES)
-        error_count = sum(1 for r in results if r.status == "network_error")
-        total_latency = sum(r.latency_ms for r in results)
+        results.sort(key=attrgetter("provider", "env_var"))
+
+        # Build summary — one pass over results rather than one per counter
+        valid_count = fail_count = error_count = 0
+        total_latency = 0.0
+        failing = FAILING_STATUSES
+        for r in results:
+            status = r.status
+            if status == "valid":
+                valid_count += 1
+            elif status in failing:
+                fail_count += 1
+            elif status == "network_error":
+                error_count += 1
+            total_latency += r.latency_ms
 
         summary = AuditSummary(
             total_keys=len(results),
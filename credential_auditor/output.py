@@ -7,13 +7,14 @@ Design sources:
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Optional
 
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 
+from credential_auditor.jsonio import dumps
 from credential_auditor.models import AuditSummary, KeyResult
 from credential_auditor.security import check_output_permissions, redact_key
 
@@ -41,8 +42,7 @@ def render_table(results: list[KeyResult], console: Optional[Console] = None, re
     for r in results:
         fpd = r.key_fingerprint.to_dict(redaction_level)
         raw_fp = fpd.get("redacted") or f"{fpd['prefix']}...{fpd['suffix']} ({fpd['length']})"
-        from rich.text import Text
-        fp = Text(raw_fp)
+        fp = Text(raw_fp)  # literal: "[sha256:...]" / "[REDACTED]" would parse as markup
         color = _STATUS_COLORS.get(r.status, "white")
         detail = r.account_info or r.error_detail or ""
         table.add_row(r.provider, r.env_var, fp, f"[{color}]{r.status}[/{color}]", detail)
@@ -73,6 +73,6 @@ def write_json(
     payload: dict | list = [r.to_dict(redaction_level) for r in results]
     if summary:
         payload = {"summary": summary.to_dict(), "results": payload}
-    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n")
+    path.write_bytes(dumps(payload, indent=True) + b"\n")
     console.print(f"[green]Results written to {path}[/green]")
     return True
@@ -8,16 +8,20 @@ Design sources:
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import importlib
 import pkgutil
 import re
 import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, ClassVar, Optional, Pattern
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Mapping, Optional, Pattern
 
 import httpx
 
+from credential_auditor.jsonio import loads
 from credential_auditor.models import (
     KeyFingerprint,
     KeyResult,
@@ -35,6 +39,8 @@ class Provider(ABC):
     """
 
     _registry: ClassVar[dict[str, type[Provider]]] = {}
+    # Live read-only view handed out by get_registry(), built once
+    _registry_view: ClassVar[Mapping[str, type[Provider]]] = MappingProxyType(_registry)
 
     # Subclasses MUST define these
     name: ClassVar[str]
@@ -47,8 +53,9 @@ class Provider(ABC):
             Provider._registry[cls.name] = cls
 
     @classmethod
-    def get_registry(cls) -> dict[str, type[Provider]]:
-        return dict(cls._registry)
+    def get_registry(cls) -> Mapping[str, type[Provider]]:
+        """Read-only view of registered providers; copy it to get a snapshot."""
+        return cls._registry_view
 
     @classmethod
     def get_provider(cls, name: str) -> Provider:
@@ -56,8 +63,10 @@ class Provider(ABC):
             raise ValueError(f"Unknown provider: {name}. Available: {list(cls._registry)}")
         return cls._registry[name]()
 
-    def matches_env_var(self, env_var: str) -> bool:
-        return any(p.match(env_var) for p in self.env_patterns)
+    @classmethod
+    def matches_env_var(cls, env_var: str) -> bool:
+        """True if *env_var* belongs to this provider. Class-level: needs no instance."""
+        return any(p.match(env_var) for p in cls.env_patterns)
 
     def check_format(self, key: str) -> tuple[bool, Optional[str]]:
         """Validate key format without network. Returns (ok, error_msg)."""
@@ -82,17 +91,20 @@ class Provider(ABC):
                 provider=self.name, env_var=env_var, key_fingerprint=fingerprint,
                 status="invalid_format", error_detail=fmt_err,
             )
-        start = time.monotonic()
+        start = time.perf_counter_ns()
         try:
             status, account, scopes, rate_limit, usage, error = await self.validate(key, client)
-        except Exception as exc:
-            latency = (time.monotonic() - start) * 1000
+        except (httpx.HTTPError, OSError, asyncio.TimeoutError) as exc:
+            # Transport failures only; anything else is a provider bug and
+            # propagates to the orchestrator's per-worker exception capture
+            latency = round((time.perf_counter_ns() - start) / 1e6, 2)
             return KeyResult(
                 provider=self.name, env_var=env_var, key_fingerprint=fingerprint,
                 status="network_error", latency_ms=latency,
                 error_detail=f"{type(exc).__name__}: {exc}",
             )
-        latency = (time.monotonic() - start) * 1000
+        # Rounded once here rather than on every to_dict()
+        latency = round((time.perf_counter_ns() - start) / 1e6, 2)
         return KeyResult(
             provider=self.name, env_var=env_var, key_fingerprint=fingerprint,
             status=status, account_info=account, scopes=scopes,
@@ -101,16 +113,26 @@ class Provider(ABC):
         )
 
 
+def _bearer(key: str) -> dict[str, str]:
+    """Authorization header dict for Bearer-token providers."""
+    return {"Authorization": "Bearer " + key}
+
+
 _MAX_RESPONSE_BYTES = 5 * 1024 * 1024  # 5 MB — reject oversized responses
 
 
 def _safe_json(resp: httpx.Response) -> dict[str, Any]:
-    """Parse JSON response body, returning empty dict on failure."""
+    """Parse JSON response body, returning empty dict on failure.
+
+    Decodes the raw bytes with the shared jsonio loader (orjson when the
+    fast extra is installed) instead of httpx's text-then-json path.
+    """
     try:
-        if len(resp.content) > _MAX_RESPONSE_BYTES:
+        body = resp.content
+        if len(body) > _MAX_RESPONSE_BYTES:
             return {}
         if resp.headers.get("content-type", "").startswith("application/json"):
-            result = resp.json()
+            result = loads(body)
             if isinstance(result, dict):
                 return result
             return {}
@@ -178,26 +200,129 @@ def _charset_specificity(pattern: str) -> int:
     return score
 
 
-def detect_provider_by_key(key: str) -> Optional[Provider]:
-    """Auto-detect provider from key value pattern (not env var name)."""
-    matches = [
-        (name, cls) for name, cls in Provider.get_registry().items()
-        if cls.key_format.match(key)
+def env_var_matcher(providers: Mapping[str, type[Provider]]) -> Callable[[str], Optional[str]]:
+    """Return a function mapping an env var name to its first matching provider name.
+
+    When every provider uses the stock matches_env_var, all env_patterns are
+    folded into one alternation (one named group per pattern, in *providers*
+    order), so each variable costs a single match() however many providers
+    there are. Otherwise — an override, mixed flags, backreferences — it
+    falls back to asking each provider in turn.
+    """
+    default = Provider.matches_env_var.__func__  # type: ignore[attr-defined]
+    owners: dict[str, str] = {}
+    parts: list[str] = []
+    flags: set[int] = set()
+    combinable = True
+    for name, cls in providers.items():
+        if getattr(cls.matches_env_var, "__func__", None) is not default:
+            combinable = False
+            break
+        for pat in cls.env_patterns:
+            if re.search(r"\\[1-9]", pat.pattern):  # numbered backrefs would shift
+                combinable = False
+                break
+            group = f"_{len(parts)}"
+            owners[group] = name
+            parts.append(f"(?P<{group}>{pat.pattern})")
+            flags.add(pat.flags)
+    if combinable and len(flags) <= 1:
+        if not parts:
+            return lambda env_var: None
+        try:
+            union = re.compile("|".join(parts), flags.pop())
+        except re.error:
+            pass
+        else:
+            def match_union(env_var: str) -> Optional[str]:
+                m = union.match(env_var)
+                return owners[m.lastgroup] if m and m.lastgroup else None
+
+            return match_union
+
+    # Classmethod overrides are called on the class; only an override written
+    # as a plain instance method needs an instance, made once here
+    checks = [
+        (name, cls.matches_env_var if getattr(cls.matches_env_var, "__self__", None) is cls
+         else cls().matches_env_var)
+        for name, cls in providers.items()
     ]
-    if not matches:
+
+    def match_each(env_var: str) -> Optional[str]:
+        for name, check in checks:
+            if check(env_var):
+                return name
+        return None
+
+    return match_each
+
+
+def _key_format_rank(cls: type[Provider]) -> tuple[int, int, int]:
+    pat = cls.key_format.pattern
+    return (_literal_prefix_len(pat), -_charset_specificity(pat), len(pat))
+
+
+@functools.lru_cache(maxsize=8)
+def _ranked_providers(classes: tuple[type[Provider], ...]) -> tuple[type[Provider], ...]:
+    """*classes* ordered most specific key_format first; stable for ties.
+
+    Keyed on the registry contents, so the ranking is computed once per
+    registry state rather than re-sorted for every key.
+    """
+    return tuple(sorted(classes, key=_key_format_rank, reverse=True))
+
+
+@functools.lru_cache(maxsize=8)
+def _key_format_matcher(classes: tuple[type[Provider], ...]) -> Callable[[str], Optional[type[Provider]]]:
+    """Return a function mapping a key to the first ranked provider whose key_format matches.
+
+    Like env_var_matcher, the key_format patterns are folded into one
+    alternation in rank order (re tries alternatives left to right, so the
+    first match is the most specific), falling back to one match() per
+    provider when flags differ or a pattern uses numbered backreferences.
+    """
+    ranked = _ranked_providers(classes)
+    owners: dict[str, type[Provider]] = {}
+    parts: list[str] = []
+    flags = {cls.key_format.flags for cls in ranked}
+    if len(flags) == 1 and not any(re.search(r"\\[1-9]", cls.key_format.pattern) for cls in ranked):
+        for cls in ranked:
+            group = f"_{len(parts)}"
+            owners[group] = cls
+            parts.append(f"(?P<{group}>{cls.key_format.pattern})")
+        try:
+            union = re.compile("|".join(parts), flags.pop())
+        except re.error:
+            pass
+        else:
+            def match_union(key: str) -> Optional[type[Provider]]:
+                m = union.match(key)
+                return owners[m.lastgroup] if m and m.lastgroup else None
+
+            return match_union
+
+    def match_each(key: str) -> Optional[type[Provider]]:
+        for cls in ranked:
+            if cls.key_format.match(key):
+                return cls
         return None
 
-    def _sort_key(item: tuple[str, type[Provider]]) -> tuple[int, int, int]:
-        _name, cls = item
-        pat = cls.key_format.pattern
-        return (_literal_prefix_len(pat), -_charset_specificity(pat), len(pat))
+    return match_each
+
 
-    matches.sort(key=_sort_key, reverse=True)
-    return matches[0][1]()
+def detect_provider_by_key(key: str) -> Optional[Provider]:
+    """Auto-detect provider from key value pattern (not env var name)."""
+    cls = _key_format_matcher(tuple(Provider._registry.values()))(key)
+    return cls() if cls is not None else None
 
 
+@functools.lru_cache(maxsize=None)
 def discover_providers() -> None:
-    """Import all provider modules in this package to trigger __init_subclass__ registration."""
+    """Import all provider modules in this package to trigger __init_subclass__ registration.
+
+    Runs once per process: later calls (every audit(), every TUI refresh)
+    return without rescanning the package directory.
+    """
     package_dir = Path(__file__).parent
     for info in pkgutil.iter_modules([str(package_dir)]):
         if info.name.startswith("_"):
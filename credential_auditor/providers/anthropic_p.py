@@ -15,7 +15,7 @@ from credential_auditor.providers import Provider, _safe_json
 class AnthropicProvider(Provider):
     name: ClassVar[str] = "anthropic"
     env_patterns: ClassVar[list[re.Pattern[str]]] = [re.compile(r"^ANTHROPIC_API_KEY(_ALT\d+)?$")]
-    key_format: ClassVar[re.Pattern[str]] = re.compile(r"^sk-ant-[A-Za-z0-9_-]{20,}(_ALT\d+)?$")
+    key_format: ClassVar[re.Pattern[str]] = re.compile(r"^sk-ant-[A-Za-z0-9_-]{20,}$")
 
     async def validate(self, key: str, client: httpx.AsyncClient) -> tuple[
         Status, Optional[str], Optional[list[str]], Optional[RateLimitInfo],
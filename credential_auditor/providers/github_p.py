@@ -15,7 +15,7 @@ from typing import ClassVar, Optional
 import httpx
 
 from credential_auditor.models import RateLimitInfo, Status
-from credential_auditor.providers import Provider, _extract_rate_limit, _safe_json
+from credential_auditor.providers import Provider, _bearer, _extract_rate_limit, _safe_json
 
 
 class GitHubProvider(Provider):
@@ -25,7 +25,7 @@ class GitHubProvider(Provider):
         re.compile(r"^GH_TOKEN(_ALT\d+)?$"),
     ]
     key_format: ClassVar[re.Pattern[str]] = re.compile(
-        r"^(ghp_[A-Za-z0-9]{36}|gho_[A-Za-z0-9]{36}|github_pat_[A-Za-z0-9_]{22,}|v[0-9]\.[0-9a-f]{40})$"
+        r"^(?:ghp_[A-Za-z0-9]{36}|gho_[A-Za-z0-9]{36}|github_pat_[A-Za-z0-9_]{22,}|v[0-9]\.[0-9a-f]{40})$"
     )
 
     async def validate(self, key: str, client: httpx.AsyncClient) -> tuple[
@@ -34,7 +34,7 @@ class GitHubProvider(Provider):
     ]:
         resp = await client.get(
             "https://api.github.com/user",
-            headers={"Authorization": f"Bearer {key}", "Accept": "application/vnd.github+json"},
+            headers={**_bearer(key), "Accept": "application/vnd.github+json"},
         )
         rl = _extract_rate_limit(resp)
         if resp.status_code == 200:
@@ -8,7 +8,7 @@ from typing import ClassVar, Optional
 import httpx
 
 from credential_auditor.models import RateLimitInfo, Status
-from credential_auditor.providers import Provider, _safe_json
+from credential_auditor.providers import Provider, _bearer, _safe_json
 
 
 class HuggingFaceProvider(Provider):
@@ -16,7 +16,7 @@ class HuggingFaceProvider(Provider):
     env_patterns: ClassVar[list[re.Pattern[str]]] = [
         re.compile(r"^(HUGGINGFACE_TOKEN|HF_TOKEN|HF_API_KEY|HF_PERSONAL_AUTHENTICATION_TOKEN|HUGGING_FACE_API_KEY)(_ALT\d+)?$"),
     ]
-    key_format: ClassVar[re.Pattern[str]] = re.compile(r"^hf_[A-Za-z0-9]{20,}(_ALT\d+)?$")
+    key_format: ClassVar[re.Pattern[str]] = re.compile(r"^hf_[A-Za-z0-9]{20,}$")
 
     async def validate(self, key: str, client: httpx.AsyncClient) -> tuple[
         Status, Optional[str], Optional[list[str]], Optional[RateLimitInfo],
@@ -24,7 +24,7 @@ class HuggingFaceProvider(Provider):
     ]:
         resp = await client.get(
             "https://huggingface.co/api/whoami-v2",
-            headers={"Authorization": f"Bearer {key}"},
+            headers=_bearer(key),
         )
         if resp.status_code == 200:
             data = _safe_json(resp)
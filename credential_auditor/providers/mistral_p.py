@@ -8,7 +8,7 @@ from typing import ClassVar, Optional
 import httpx
 
 from credential_auditor.models import RateLimitInfo, Status
-from credential_auditor.providers import Provider, _safe_json
+from credential_auditor.providers import Provider, _bearer, _safe_json
 
 
 class MistralProvider(Provider):
@@ -22,7 +22,7 @@ class MistralProvider(Provider):
     ]:
         resp = await client.get(
             "https://api.mistral.ai/v1/models",
-            headers={"Authorization": f"Bearer {key}"},
+            headers=_bearer(key),
         )
         if resp.status_code == 200:
             count = len(_safe_json(resp).get("data", []))
@@ -8,7 +8,7 @@ from typing import ClassVar, Optional
 import httpx
 
 from credential_auditor.models import RateLimitInfo, Status
-from credential_auditor.providers import Provider, _extract_rate_limit, _safe_json
+from credential_auditor.providers import Provider, _bearer, _extract_rate_limit, _safe_json
 
 
 class OpenAIProvider(Provider):
@@ -25,7 +25,7 @@ class OpenAIProvider(Provider):
     ]:
         resp = await client.get(
             "https://api.openai.com/v1/models",
-            headers={"Authorization": f"Bearer {key}"},
+            headers=_bearer(key),
         )
         rl = _extract_rate_limit(resp)
         if resp.status_code == 200:
@@ -8,13 +8,13 @@ from typing import ClassVar, Optional
 import httpx
 
 from credential_auditor.models import RateLimitInfo, Status
-from credential_auditor.providers import Provider, _safe_json
+from credential_auditor.providers import Provider, _bearer, _safe_json
 
 
 class SendGridProvider(Provider):
     name: ClassVar[str] = "sendgrid"
     env_patterns: ClassVar[list[re.Pattern[str]]] = [re.compile(r"^SENDGRID_API_KEY(_ALT\d+)?$")]
-    key_format: ClassVar[re.Pattern[str]] = re.compile(r"^SG\.[A-Za-z0-9_-]{22}\.[A-Za-z0-9_-]{43}(_ALT\d+)?$")
+    key_format: ClassVar[re.Pattern[str]] = re.compile(r"^SG\.[A-Za-z0-9_-]{22}\.[A-Za-z0-9_-]{43}$")
 
     async def validate(self, key: str, client: httpx.AsyncClient) -> tuple[
         Status, Optional[str], Optional[list[str]], Optional[RateLimitInfo],
@@ -22,7 +22,7 @@ class SendGridProvider(Provider):
     ]:
         resp = await client.get(
             "https://api.sendgrid.com/v3/scopes",
-            headers={"Authorization": f"Bearer {key}"},
+            headers=_bearer(key),
         )
         if resp.status_code == 200:
             data = _safe_json(resp)
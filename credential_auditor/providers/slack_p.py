@@ -8,13 +8,13 @@ from typing import ClassVar, Optional
 import httpx
 
 from credential_auditor.models import RateLimitInfo, Status
-from credential_auditor.providers import Provider, _safe_json
+from credential_auditor.providers import Provider, _bearer, _safe_json
 
 
 class SlackProvider(Provider):
     name: ClassVar[str] = "slack"
     env_patterns: ClassVar[list[re.Pattern[str]]] = [re.compile(r"^SLACK_(BOT_TOKEN|TOKEN|API_TOKEN)(_ALT\d+)?$")]
-    key_format: ClassVar[re.Pattern[str]] = re.compile(r"^xox[bpas]-[A-Za-z0-9-]{10,}(_ALT\d+)?$")
+    key_format: ClassVar[re.Pattern[str]] = re.compile(r"^xox[bpas]-[A-Za-z0-9-]{10,}$")
 
     async def validate(self, key: str, client: httpx.AsyncClient) -> tuple[
         Status, Optional[str], Optional[list[str]], Optional[RateLimitInfo],
@@ -22,7 +22,7 @@ class SlackProvider(Provider):
     ]:
         resp = await client.post(
             "https://slack.com/api/auth.test",
-            headers={"Authorization": f"Bearer {key}"},
+            headers=_bearer(key),
         )
         if resp.status_code == 429:
             retry = resp.headers.get("Retry-After", "unknown")
@@ -16,7 +16,7 @@ class StripeProvider(Provider):
     env_patterns: ClassVar[list[re.Pattern[str]]] = [
         re.compile(r"^(STRIPE_(SECRET_KEY|API_KEY|RESTRICTED_KEY)|PRIVATE_KEY)(_ALT\d+)?$"),
     ]
-    key_format: ClassVar[re.Pattern[str]] = re.compile(r"^(sk|rk)_(test|live)_[A-Za-z0-9]{10,}(_ALT\d+)?$")
+    key_format: ClassVar[re.Pattern[str]] = re.compile(r"^(?:sk|rk)_(?:test|live)_[A-Za-z0-9]{10,}$")
 
     async def validate(self, key: str, client: httpx.AsyncClient) -> tuple[
         Status, Optional[str], Optional[list[str]], Optional[RateLimitInfo],
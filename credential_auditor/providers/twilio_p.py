@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import re
 from typing import ClassVar, Optional
 
@@ -10,6 +11,9 @@ import httpx
 from credential_auditor.models import RateLimitInfo, Status
 from credential_auditor.providers import Provider, _safe_json
 
+# SEC: Validate SID format to prevent SSRF via path traversal (case-insensitive hex)
+_SID_RE = re.compile(r"^AC[a-fA-F0-9]{32}$")
+
 
 class TwilioProvider(Provider):
     name: ClassVar[str] = "twilio"
@@ -20,13 +24,12 @@ class TwilioProvider(Provider):
         Status, Optional[str], Optional[list[str]], Optional[RateLimitInfo],
         Optional[dict], Optional[str],
     ]:
-        # Need the account SID from env — stored during matching
-        import os
+        # Read per call, not at construction: audit() instantiates providers
+        # before it exposes the .env's TWILIO_ACCOUNT_SID to the environment
         sid = os.environ.get("TWILIO_ACCOUNT_SID", "")
         if not sid:
             return "network_error", None, None, None, None, "TWILIO_ACCOUNT_SID not set"
-        # SEC: Validate SID format to prevent SSRF via path traversal (case-insensitive hex)
-        if not re.match(r"^AC[a-fA-F0-9]{32}$", sid):
+        if not _SID_RE.match(sid):
             return "network_error", None, None, None, None, "Invalid TWILIO_ACCOUNT_SID format"
         resp = await client.get(
             f"https://api.twilio.com/2010-04-01/Accounts/{sid}.json",
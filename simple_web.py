@@ -40,6 +40,7 @@ _RECOVERY_GROUPS = 4
 _RECOVERY_BYTES_PER_GROUP = 4  # 4×32 bits = 128-bit recovery keys
 _USERNAME_RE = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
 _ENV_KEY_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_SECRET_NAME_RE = re.compile(r"KEY|TOKEN|SECRET|PASSWORD|API", re.I)  # env scan: names worth importing
 
 
 def _valid_env_key(key: str) -> bool:
@@ -1495,7 +1496,7 @@ class Handler(BaseHTTPRequestHandler):
                                 k, _, v = part.partition("=")
                                 k = k.strip()
                                 v = v.strip().strip("'\"")
-                                if k and v and any(p in k.upper() for p in ("KEY", "TOKEN", "SECRET", "PASSWORD", "API")):
+                                if k and v and _SECRET_NAME_RE.search(k):
                                     found[k] = v
                     except Exception:
                         pass
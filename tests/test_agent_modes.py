@@ -64,6 +64,33 @@ class TestEnv:
     def test_missing_command_exits_2(self, env_dir):
         r = _run(["--env"], env_dir)
         assert r.returncode == 2
+        assert _run(["--env", "--keep-parent"], env_dir).returncode == 2
+
+    @pytest.mark.skipif(os.name == "nt", reason="exec only replaces the process on POSIX")
+    @pytest.mark.parametrize("keep_parent", [False, True])
+    def test_exec_replaces_broker(self, env_dir, keep_parent):
+        flag = ["--keep-parent"] if keep_parent else []
+        proc = subprocess.Popen(
+            [PYTHON, str(AGENT_API), "--env", *flag, "sh", "-c", 'echo "$$"; exit 3'],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, cwd=str(env_dir),
+        )
+        out, _ = proc.communicate(timeout=10)
+        assert proc.returncode == 3
+        assert (int(out.strip()) == proc.pid) is not keep_parent
+        log = (env_dir / "agent_access.log").read_text()
+        assert '"env_inject"' in log
+
+    def test_command_options_passed_through(self, env_dir):
+        code = "import sys; print(sys.argv[1:])"
+        r = _run(["--quiet", "--env", PYTHON, "-c", code,
+                  "--workers", "4", "--quiet", "--env-file", "x"], env_dir)
+        assert r.returncode == 0
+        assert r.stdout.strip() == "['--workers', '4', '--quiet', '--env-file', 'x']"
+
+    def test_unknown_command_exits_127(self, env_dir):
+        r = _run(["--env", "definitely-not-a-command-xyz"], env_dir)
+        assert r.returncode == 127
+        assert "Cannot run" in r.stderr
 
 
 # ── --write-env ──
@@ -145,6 +172,46 @@ class TestMCP:
         # get denied
         assert "denied" in r[4]["result"]["content"][0]["text"].lower()
 
+    def test_tool_dispatch(self, env_dir):
+        r = self._mcp_session(env_dir, [
+            {"jsonrpc": "2.0", "method": "tools/list", "id": 1},
+            {"jsonrpc": "2.0", "method": "tools/call", "id": 2,
+             "params": {"name": "report_usage", "arguments": {"key": "TEST_KEY_A", "tokens": "x"}}},
+            {"jsonrpc": "2.0", "method": "tools/call", "id": 3,
+             "params": {"name": "report_usage", "arguments": {"key": "TEST_KEY_A", "tokens": 5}}},
+            {"jsonrpc": "2.0", "method": "tools/call", "id": 4,
+             "params": {"name": "nope", "arguments": {}}},
+        ])
+        advertised = {t["name"] for t in r[0]["result"]["tools"]}
+        assert advertised == {"get_credential", "list_credentials", "report_usage"}
+        assert r[1]["error"]["code"] == -32602
+        assert r[2]["result"]["content"][0]["text"] == "usage recorded"
+        assert r[3]["error"] == {"code": -32601, "message": "Unknown tool: nope"}
+
+    def test_pipelined_frames_in_one_write(self, env_dir):
+        """Several frames (CRLF and bare-LF headers, non-ASCII body) sent at once."""
+        def frame(msg, sep=b"\r\n"):
+            body = json.dumps(msg, ensure_ascii=False).encode()
+            return b"Content-Length: %d%s%s%s" % (len(body), sep, sep, body)
+
+        ping = {"jsonrpc": "2.0", "method": "ping", "id": 1, "params": {"note": "héllo ✓"}}
+        get_b = {"jsonrpc": "2.0", "method": "tools/call", "id": 2,
+                 "params": {"name": "get_credential", "arguments": {"name": "TEST_KEY_B"}}}
+        r = subprocess.run(
+            [PYTHON, str(AGENT_API), "--mcp"],
+            input=frame(ping) + b"\r\n" + frame(get_b, b"\n"),
+            capture_output=True, cwd=str(env_dir), timeout=10,
+        )
+        out, responses = r.stdout, []
+        while out:
+            head, _, rest = out.partition(b"\r\n\r\n")
+            length = int(head.split(b":")[1])
+            responses.append(json.loads(rest[:length]))
+            out = rest[length:]
+        assert [m["id"] for m in responses] == [1, 2]
+        assert responses[0]["result"] == {}
+        assert responses[1]["result"]["content"][0]["text"] == "value_b"
+
 
 # ── Scoped permissions ──
 
@@ -211,6 +278,20 @@ class TestCredScope:
         time.sleep(1.1)
         assert "expired" in s.check()
 
+    def test_denial_is_sticky(self, monkeypatch):
+        from agent_api import _CredScope
+        import time
+        now = [1000.0]
+        monkeypatch.setattr(time, "time", lambda: now[0])
+        s = _CredScope(expires="10s")
+        assert s.check_and_record() is None
+        now[0] += 11
+        assert s.check_and_record() == "credential access expired"
+        monkeypatch.setattr(time, "time", lambda: pytest.fail("clock read after expiry"))
+        assert s.check() == "credential access expired"
+        assert s.check_and_record() == "credential access expired"
+        assert s.uses == 1
+
 
 class TestScopedExport:
     def test_unallowed_excluded(self, scoped_dir):
@@ -253,3 +334,75 @@ class TestScopedMCP:
         assert r[2]["result"]["content"][0]["text"] == "aaa"
         # Third is denied
         assert "exhausted" in r[3]["result"]["content"][0]["text"]
+
+
+class TestLoadEnv:
+    def test_plain_lines_skip_dotenv(self, tmp_path, monkeypatch):
+        from agent_api import _load_env
+        monkeypatch.setitem(sys.modules, "dotenv", None)  # import would raise
+        (tmp_path / ".env").write_text(
+            "# keys\n\nA=1\nexport B='two words'\nC=\"x=y\"\r\n D = spaced \nE=\n")
+        assert _load_env(tmp_path / ".env") == {"A": "1", "B": "two words", "C": "x=y", "D": "spaced"}
+
+    @pytest.mark.parametrize("text,expected", [
+        ("A=1 # note\n", {"A": "1"}),
+        ("A=1\nB=${A}\n", {"A": "1", "B": "1"}),
+        ('A="multi\nline"\n', {"A": "multi\nline"}),
+        ('A="esc\\"aped"\n', {"A": 'esc"aped'}),
+        # Single quotes still decode \\ and \' in dotenv
+        ("A='a\\\\b'\n", {"A": "a\\b"}),
+        ("A='a\\'\n", {}),
+    ])
+    def test_complex_files_use_dotenv(self, tmp_path, text, expected):
+        from agent_api import _load_env
+        (tmp_path / ".env").write_text(text)
+        assert _load_env(tmp_path / ".env") == expected
+
+    def test_missing_file(self, tmp_path):
+        from agent_api import _load_env
+        assert _load_env(tmp_path / ".env") == {}
+
+
+class TestLoadPermissions:
+    def test_allowed_set_matches_names(self, scoped_dir):
+        from agent_api import _load_permissions
+        perms = _load_permissions(scoped_dir)
+        assert perms["allowed"] == ["KEY_A", "KEY_C"]
+        assert perms["allowed_set"] == frozenset({"KEY_A", "KEY_C"})
+
+    def test_missing_file_has_empty_set(self, tmp_path):
+        from agent_api import _load_permissions
+        perms = _load_permissions(tmp_path)
+        assert perms["deny_all"] is True
+        assert perms["allowed_set"] == frozenset()
+
+    def test_names_interned(self, scoped_dir):
+        import sys
+        from agent_api import _load_env, _load_permissions
+        perms = _load_permissions(scoped_dir)
+        env = _load_env(scoped_dir / ".env")
+        for name in perms["allowed"]:
+            assert name is sys.intern(name)
+        for name in env:
+            assert name is sys.intern(name)
+
+    def test_unchanged_file_parsed_once(self, scoped_dir):
+        from agent_api import PERMISSIONS_FILE, _load_permissions
+        first = _load_permissions(scoped_dir)
+        assert _load_permissions(scoped_dir) is first
+        (scoped_dir / PERMISSIONS_FILE).write_text(json.dumps({"allowed": ["KEY_B"]}))
+        assert _load_permissions(scoped_dir)["allowed"] == ["KEY_B"]
+
+    @pytest.mark.parametrize("raw", [b"{not json", b'{"allowed": ["\xff"]}'])
+    def test_unreadable_file_denies_all(self, tmp_path, raw):
+        from agent_api import PERMISSIONS_FILE, _load_permissions
+        (tmp_path / PERMISSIONS_FILE).write_bytes(raw)
+        assert _load_permissions(tmp_path)["deny_all"] is True
+
+
+class TestAccessLogFlushedOnExit:
+    def test_export_logs_event(self, env_dir):
+        r = _run(["--export"], env_dir)
+        assert r.returncode == 0
+        lines = (env_dir / "agent_access.log").read_text().splitlines()
+        assert json.loads(lines[-1])["event"] == "shell_export"
@@ -0,0 +1,610 @@
+"""In-process tests for the agent_api HTTP broker (server + handler behaviour)."""
+
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import socket
+import threading
+import urllib.error
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+import agent_api
+
+TOKEN = "test-token-0123456789abcdef"
+
+
+@pytest.fixture()
+def broker(tmp_path: Path):
+    """Serve _make_handler on an ephemeral port; yield (base_url, base_dir)."""
+    (tmp_path / ".env").write_text(
+        "OPENAI_API_KEY=sk-test\nANTHROPIC_API_KEY=sk-ant-test\nOTHER_VAR=x\n"
+    )
+    (tmp_path / agent_api.PERMISSIONS_FILE).write_text(
+        json.dumps({"allowed": ["OPENAI_API_KEY", "MISSING_KEY"]})
+    )
+    env_vars = agent_api._load_env(tmp_path / ".env")
+    permissions = agent_api._load_permissions(tmp_path)
+    tracker = agent_api._UsageTracker(tmp_path)
+    handler = agent_api._make_handler(TOKEN, env_vars, permissions, tmp_path, 0, tracker,
+                                      env_path=tmp_path / ".env", reload_interval=0)
+    server = agent_api._AgentHTTPServer(("127.0.0.1", 0), handler)
+    th = threading.Thread(target=server.serve_forever, daemon=True)
+    th.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", tmp_path
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _request(base_url: str, path: str, method: str = "GET", token: str = TOKEN,
+             data: bytes | None = None) -> tuple[int, dict]:
+    req = urllib.request.Request(
+        base_url + path, data=data, method=method,
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        raw = e.read()
+        return e.code, json.loads(raw) if raw.startswith(b"{") else {}
+
+
+class TestServerConfig:
+    def test_backlog_and_threads(self):
+        assert agent_api._AgentHTTPServer.request_queue_size >= 128
+        assert agent_api._AgentHTTPServer.daemon_threads is True
+
+    def test_single_listener_by_default(self, tmp_path):
+        handler = agent_api._make_handler(TOKEN, {}, agent_api._load_permissions(tmp_path), tmp_path)
+        servers = agent_api._bind_servers(0, handler)
+        try:
+            assert len(servers) == 1
+            assert servers[0].reuse_port is False
+        finally:
+            servers[0].server_close()
+
+    @pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="needs SO_REUSEPORT")
+    def test_reuse_port_workers_share_port(self, tmp_path):
+        handler = agent_api._make_handler(TOKEN, {}, agent_api._load_permissions(tmp_path), tmp_path)
+        servers = agent_api._bind_servers(0, handler, workers=3)
+        try:
+            assert len(servers) == 3
+            assert len({srv.server_address[1] for srv in servers}) == 1
+            for srv in servers:
+                assert srv.socket.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT)
+                threading.Thread(target=srv.serve_forever, daemon=True).start()
+            base_url = f"http://127.0.0.1:{servers[0].server_address[1]}"
+            for _ in range(6):
+                assert _request(base_url, "/health")[0] == 200
+        finally:
+            for srv in servers:
+                srv.shutdown()
+                srv.server_close()
+
+    def test_parallel_credential_requests(self, broker):
+        base_url, _ = broker
+        results = []
+        threads = [threading.Thread(
+            target=lambda: results.append(_request(base_url, "/credentials/OPENAI_API_KEY", "POST")))
+            for _ in range(20)]
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join(timeout=10)
+        assert len(results) == 20
+        assert all(r == (200, {"env_var": "OPENAI_API_KEY", "value": "sk-test"}) for r in results)
+        status, usage = _request(base_url, "/usage/OPENAI_API_KEY")
+        assert usage["requests"] == 20
+
+    def test_stalled_client_does_not_block_others(self, broker):
+        base_url, _ = broker
+        host, port = base_url[7:].split(":")
+        # Open a connection and send only half a request line
+        stalled = socket.create_connection((host, int(port)))
+        try:
+            stalled.sendall(b"GET /hea")
+            status, body = _request(base_url, "/health")
+            assert status == 200
+            assert body["status"] == "ok"
+        finally:
+            stalled.close()
+
+
+class TestResponseFormat:
+    def test_status_line_and_headers(self, broker):
+        base_url, _ = broker
+        req = urllib.request.Request(base_url + "/health", headers={"Authorization": f"Bearer {TOKEN}"})
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            body = resp.read()
+            assert resp.status == 200
+            assert resp.reason == "OK"
+            assert resp.headers["Content-Type"] == "application/json"
+            assert int(resp.headers["Content-Length"]) == len(body)
+            assert resp.headers["X-Content-Type-Options"] == "nosniff"
+            assert resp.headers["X-Frame-Options"] == "DENY"
+            assert resp.headers["Referrer-Policy"] == "no-referrer"
+            assert resp.headers["Cache-Control"] == "no-store"
+
+    def test_error_reason_phrase(self, broker):
+        base_url, _ = broker
+        req = urllib.request.Request(base_url + "/credentials/OTHER_VAR", data=b"", method="POST",
+                                     headers={"Authorization": f"Bearer {TOKEN}"})
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            urllib.request.urlopen(req, timeout=5)
+        assert exc.value.code == 403
+        assert exc.value.reason == "Forbidden"
+
+
+def _conn(base_url: str) -> http.client.HTTPConnection:
+    host, port = base_url[7:].split(":")
+    return http.client.HTTPConnection(host, int(port), timeout=5)
+
+
+class TestKeepAlive:
+    AUTH = {"Authorization": f"Bearer {TOKEN}"}
+
+    def test_connection_reused(self, broker):
+        base_url, _ = broker
+        conn = _conn(base_url)
+        try:
+            conn.request("GET", "/health", headers=self.AUTH)
+            conn.getresponse().read()
+            sock = conn.sock
+            conn.request("GET", "/credentials", headers=self.AUTH)
+            resp = conn.getresponse()
+            assert resp.status == 200
+            assert json.loads(resp.read())["total"] == 1
+            assert conn.sock is sock
+        finally:
+            conn.close()
+
+    def test_post_body_consumed(self, broker):
+        base_url, _ = broker
+        conn = _conn(base_url)
+        try:
+            for _ in range(2):
+                conn.request("POST", "/credentials/OPENAI_API_KEY", body=b'{"junk": true}',
+                             headers=self.AUTH)
+                resp = conn.getresponse()
+                assert resp.status == 200
+                assert json.loads(resp.read())["value"] == "sk-test"
+        finally:
+            conn.close()
+
+    def test_send_error_is_framed(self, broker):
+        base_url, _ = broker
+        raw = _raw(base_url, b"GET /nope HTTP/1.1\r\nAuthorization: Bearer "
+                   + TOKEN.encode() + b"\r\n\r\n")
+        head, body = raw.split(b"\r\n\r\n", 1)
+        assert head.startswith(b"HTTP/1.1 404 ")
+        length = [l for l in head.split(b"\r\n") if l.lower().startswith(b"content-length:")]
+        assert length and int(length[0].split(b":")[1]) == len(body)
+        assert b"Connection: close" in head
+
+    def test_bad_content_length_closes(self, broker):
+        base_url, _ = broker
+        host, port = base_url[7:].split(":")
+        with socket.create_connection((host, int(port)), timeout=5) as s:
+            s.sendall(b"POST /usage HTTP/1.1\r\nAuthorization: Bearer " + TOKEN.encode()
+                      + b"\r\nContent-Length: nope\r\n\r\n")
+            raw = b""
+            while chunk := s.recv(4096):
+                raw += chunk
+        head = raw.split(b"\r\n\r\n", 1)[0]
+        assert head.startswith(b"HTTP/1.1 400 ")
+        assert b"Connection: close" in head
+        assert raw.count(b"HTTP/1.1 ") == 1
+
+
+class TestRequestFraming:
+    AUTH = b"Authorization: Bearer " + TOKEN.encode() + b"\r\n"
+    SMUGGLED = b"POST /credentials/OPENAI_API_KEY HTTP/1.1\r\n" + AUTH + b"Content-Length: 0\r\n\r\n"
+
+    def test_get_body_not_run_as_next_request(self, broker):
+        base_url, _ = broker
+        raw = _raw(base_url, b"GET /health HTTP/1.1\r\n" + self.AUTH
+                   + b"Content-Length: %d\r\n\r\n" % len(self.SMUGGLED) + self.SMUGGLED)
+        assert raw.startswith(b"HTTP/1.1 200 ")
+        assert b"Connection: close" in raw.split(b"\r\n\r\n", 1)[0]
+        assert raw.count(b"HTTP/1.1 ") == 1
+        assert b"sk-test" not in raw
+
+    def test_pipelined_requests_both_answered(self, broker):
+        base_url, _ = broker
+        first = b"GET /health HTTP/1.1\r\n" + self.AUTH + b"\r\n"
+        second = b"GET /credentials HTTP/1.1\r\n" + self.AUTH + b"Connection: close\r\n\r\n"
+        raw = _raw(base_url, first + second)
+        assert raw.count(b"HTTP/1.1 200 ") == 2
+
+    def test_chunked_body_rejected_and_closed(self, broker):
+        base_url, _ = broker
+        body = b"%x\r\n%s\r\n0\r\n\r\n" % (len(self.SMUGGLED), self.SMUGGLED)
+        raw = _raw(base_url, b"POST /usage HTTP/1.1\r\n" + self.AUTH
+                   + b"Transfer-Encoding: chunked\r\n\r\n" + body)
+        assert raw.startswith(b"HTTP/1.1 501 ")
+        assert b"Connection: close" in raw.split(b"\r\n\r\n", 1)[0]
+        assert raw.count(b"HTTP/1.1 ") == 1
+
+    def test_conflicting_content_length_rejected(self, broker):
+        base_url, _ = broker
+        raw = _raw(base_url, b"POST /usage HTTP/1.1\r\n" + self.AUTH
+                   + b"Content-Length: 0\r\nContent-Length: %d\r\n\r\n" % len(self.SMUGGLED)
+                   + self.SMUGGLED)
+        assert raw.startswith(b"HTTP/1.1 400 ")
+        assert raw.count(b"HTTP/1.1 ") == 1
+
+
+def _raw(base_url: str, request: bytes) -> bytes:
+    host, port = base_url[7:].split(":")
+    with socket.create_connection((host, int(port)), timeout=5) as s:
+        s.sendall(request)
+        raw = b""
+        while chunk := s.recv(4096):
+            raw += chunk
+    return raw
+
+
+class TestHeaderParsing:
+    AUTH = b"Bearer " + TOKEN.encode()
+
+    def test_header_names_case_insensitive(self, broker):
+        base_url, _ = broker
+        raw = _raw(base_url, b"GET /health HTTP/1.1\r\nAUTHORIZATION: " + self.AUTH
+                   + b"\r\nconnection: close\r\n\r\n")
+        assert raw.startswith(b"HTTP/1.1 200 ")
+
+    def test_first_duplicate_wins(self, broker):
+        base_url, _ = broker
+        raw = _raw(base_url, b"GET /health HTTP/1.1\r\nAuthorization: " + self.AUTH
+                   + b"\r\nAuthorization: Bearer nope\r\nConnection: close\r\n\r\n")
+        assert raw.startswith(b"HTTP/1.1 200 ")
+
+    def test_unusual_request_uses_stdlib_parser(self, broker):
+        base_url, _ = broker
+        raw = _raw(base_url, b"GET //health HTTP/1.1\r\nAuthorization: " + self.AUTH
+                   + b"\r\nConnection: close\r\n\r\n")
+        assert raw.startswith(b"HTTP/1.1 200 ")
+
+    def test_folded_header_rejected(self, broker):
+        base_url, _ = broker
+        raw = _raw(base_url, b"GET /health HTTP/1.1\r\nAuthorization: Bearer\r\n "
+                   + TOKEN.encode() + b"\r\n\r\n")
+        assert raw.split()[1] == b"400"
+
+    def test_too_many_headers(self, broker):
+        base_url, _ = broker
+        raw = _raw(base_url, b"GET /health HTTP/1.1\r\n" + b"X-Pad: 1\r\n" * 101 + b"\r\n")
+        assert raw.split()[1] == b"431"
+
+
+class TestAuth:
+    def test_valid_token(self, broker):
+        base_url, _ = broker
+        assert _request(base_url, "/health")[0] == 200
+
+    @pytest.mark.parametrize("token", ["", "wrong", TOKEN + "x", TOKEN[:-1]])
+    def test_bad_token_rejected(self, broker, token):
+        base_url, _ = broker
+        assert _request(base_url, "/health", token=token)[0] == 401
+
+    def test_non_ascii_header_rejected_not_crashed(self, broker):
+        base_url, _ = broker
+        host, port = base_url[7:].split(":")
+        with socket.create_connection((host, int(port)), timeout=5) as s:
+            s.sendall(b"GET /health HTTP/1.0\r\nAuthorization: Bearer \xe9\xe9\r\n\r\n")
+            raw = b""
+            while chunk := s.recv(4096):
+                raw += chunk
+        assert raw.split(b"\r\n", 1)[0].split()[1] == b"401"
+
+
+class TestRouting:
+    @pytest.mark.parametrize("method,path", [
+        ("GET", "/nope"), ("GET", "/health/"), ("GET", "/credentialsX"),
+        ("POST", "/health"), ("POST", "/credentials"),
+    ])
+    def test_unknown_route_404(self, broker, method, path):
+        base_url, _ = broker
+        assert _request(base_url, path, method, data=b"" if method == "POST" else None)[0] == 404
+
+    def test_key_usage_prefix(self, broker):
+        base_url, _ = broker
+        status, body = _request(base_url, "/usage/OPENAI_API_KEY")
+        assert status == 200
+        assert body["key"] == "OPENAI_API_KEY"
+
+
+class TestProviders:
+    def test_grouped_by_provider(self, broker):
+        base_url, _ = broker
+        status, body = _request(base_url, "/providers")
+        assert status == 200
+        assert body["providers"]["openai"] == ["OPENAI_API_KEY"]
+        assert body["providers"]["anthropic"] == ["ANTHROPIC_API_KEY"]
+        assert all("OTHER_VAR" not in v for v in body["providers"].values())
+
+    def test_matches_env_var_override_respected(self):
+        import re
+
+        from credential_auditor.providers import Provider
+
+        class SuffixProvider(Provider):
+            name = "zz_suffix"
+            env_patterns = []
+            key_format = re.compile(r"^x$")
+
+            def matches_env_var(self, env_var):
+                return env_var.endswith("_ZZTOKEN")
+
+            async def validate(self, key, client):
+                raise NotImplementedError
+
+        try:
+            grouped = agent_api._group_by_provider({"MY_ZZTOKEN": "1", "OPENAI_API_KEY": "2"})
+        finally:
+            Provider._registry.pop("zz_suffix", None)
+        assert grouped["zz_suffix"] == ["MY_ZZTOKEN"]
+        assert grouped["openai"] == ["OPENAI_API_KEY"]
+
+    def test_classmethod_override_not_instantiated(self):
+        import re
+
+        from credential_auditor.providers import Provider
+
+        class PrefixProvider(Provider):
+            name = "zz_prefix"
+            env_patterns = []
+            key_format = re.compile(r"^x$")
+
+            def __init__(self):
+                raise AssertionError("instantiated")
+
+            @classmethod
+            def matches_env_var(cls, env_var):
+                return env_var.startswith("ZZ_")
+
+            async def validate(self, key, client):
+                raise NotImplementedError
+
+        try:
+            grouped = agent_api._group_by_provider({"ZZ_KEY": "1"})
+        finally:
+            Provider._registry.pop("zz_prefix", None)
+        assert grouped["zz_prefix"] == ["ZZ_KEY"]
+
+    def test_repeated_requests_reuse_mapping(self, broker, monkeypatch):
+        base_url, _ = broker
+        first = _request(base_url, "/providers")
+        monkeypatch.setattr(agent_api, "_group_by_provider",
+                            lambda env: pytest.fail("regrouped on request"))
+        for _ in range(3):
+            assert _request(base_url, "/providers") == first
+
+    def test_warmup_populates_registry(self):
+        from credential_auditor.providers import Provider
+        agent_api._warm_providers()
+        assert "openai" in Provider.get_registry()
+
+    def test_body_built_once(self, monkeypatch, tmp_path):
+        calls = []
+        real = agent_api._group_by_provider
+        monkeypatch.setattr(agent_api, "_group_by_provider",
+                            lambda env: calls.append(1) or real(env))
+        agent_api._make_handler(TOKEN, {"OPENAI_API_KEY": "sk-x"},
+                                agent_api._load_permissions(tmp_path), tmp_path)
+        assert calls == [1]
+
+
+def _write_perms(base_dir: Path, allowed: list) -> None:
+    p = base_dir / agent_api.PERMISSIONS_FILE
+    p.write_text(json.dumps({"allowed": allowed}))
+
+
+class TestPermissionsReload:
+    def test_credentials_list(self, broker):
+        base_url, _ = broker
+        status, body = _request(base_url, "/credentials")
+        assert status == 200
+        assert body == {"allowed_credentials": ["OPENAI_API_KEY"], "total": 1}
+
+    def test_allowed_but_missing_is_404(self, broker):
+        base_url, _ = broker
+        assert _request(base_url, "/credentials/MISSING_KEY", "POST") == (
+            404, {"error": "MISSING_KEY not found in .env"})
+
+    def test_grant_body(self, broker):
+        base_url, _ = broker
+        assert _request(base_url, "/credentials/OPENAI_API_KEY", "POST") == (
+            200, {"env_var": "OPENAI_API_KEY", "value": "sk-test"})
+
+    def test_edit_takes_effect_without_restart(self, broker):
+        base_url, base_dir = broker
+        assert _request(base_url, "/credentials/ANTHROPIC_API_KEY", "POST")[0] == 403
+        _write_perms(base_dir, ["OPENAI_API_KEY", "ANTHROPIC_API_KEY"])
+        status, body = _request(base_url, "/credentials")
+        assert body["allowed_credentials"] == ["OPENAI_API_KEY", "ANTHROPIC_API_KEY"]
+        status, body = _request(base_url, "/credentials/ANTHROPIC_API_KEY", "POST")
+        assert status == 200
+        assert body["value"] == "sk-ant-test"
+
+    def test_resave_keeps_use_count(self, broker):
+        base_url, base_dir = broker
+        scoped = [{"name": "OPENAI_API_KEY", "max_uses": 1}]
+        _write_perms(base_dir, scoped)
+        assert _request(base_url, "/credentials/OPENAI_API_KEY", "POST")[0] == 200
+        # Same config, different bytes on disk — must not reset the counter
+        (base_dir / agent_api.PERMISSIONS_FILE).write_text(json.dumps({"allowed": scoped}, indent=2))
+        assert _request(base_url, "/credentials/OPENAI_API_KEY", "POST")[0] == 403
+
+    def test_truncate_then_restore_keeps_use_count(self, broker):
+        base_url, base_dir = broker
+        scoped = [{"name": "OPENAI_API_KEY", "max_uses": 2}]
+        _write_perms(base_dir, scoped)
+        assert [_request(base_url, "/credentials/OPENAI_API_KEY", "POST")[0] for _ in range(3)] == [200, 200, 403]
+        (base_dir / agent_api.PERMISSIONS_FILE).write_text('{"allowed": [')  # mid-save
+        assert _request(base_url, "/credentials/OPENAI_API_KEY", "POST")[0] == 403
+        (base_dir / agent_api.PERMISSIONS_FILE).write_text(json.dumps({"allowed": scoped}, indent=1))
+        assert _request(base_url, "/credentials/OPENAI_API_KEY", "POST")[0] == 403
+
+    def test_file_checks_throttled(self, tmp_path, monkeypatch):
+        _write_perms(tmp_path, ["OPENAI_API_KEY"])
+        handler = agent_api._make_handler(TOKEN, {"OPENAI_API_KEY": "sk"},
+                                          agent_api._load_permissions(tmp_path), tmp_path,
+                                          reload_interval=60)
+        server = agent_api._AgentHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            base_url = f"http://127.0.0.1:{server.server_address[1]}"
+            stats = []
+            real = agent_api._file_stamp
+            monkeypatch.setattr(agent_api, "_file_stamp", lambda p: stats.append(p) or real(p))
+            _write_perms(tmp_path, [])
+            for _ in range(3):
+                assert _request(base_url, "/credentials")[1]["total"] == 1
+            assert stats == []
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_deleted_file_denies(self, broker):
+        base_url, base_dir = broker
+        (base_dir / agent_api.PERMISSIONS_FILE).unlink()
+        status, body = _request(base_url, "/credentials")
+        assert status == 403
+        assert body["error"] == "No permissions configured"
+        assert agent_api.PERMISSIONS_FILE in body["setup"]
+        assert _request(base_url, "/credentials/OPENAI_API_KEY", "POST") == (
+            403, {"error": "No permissions configured"})
+
+    def test_denial_escapes_var_name(self, broker):
+        base_url, _ = broker
+        raw = _raw(base_url, b'POST /credentials/A"B\\ HTTP/1.1\r\nAuthorization: Bearer '
+                   + TOKEN.encode() + b"\r\nConnection: close\r\n\r\n")
+        head, body = raw.split(b"\r\n\r\n", 1)
+        assert head.split()[1] == b"403"
+        assert json.loads(body)["error"] == 'Access to A"B\\ not permitted'
+
+
+class TestUsageReport:
+    @pytest.mark.parametrize("data,expected", [
+        (b"{oops", (400, {"error": "invalid JSON"})),
+        (b'{"key": "K", "tokens": "x"}', (400, {"error": "tokens must be an integer"})),
+        (b'{"key": "K", "tokens": -1}', (400, {"error": "tokens out of range"})),
+        (b'{"key": "K", "tokens": 12}', (200, {"status": "ok"})),
+    ])
+    def test_post_usage(self, broker, data, expected):
+        base_url, _ = broker
+        assert _request(base_url, "/usage", "POST", data=data) == expected
+
+    def test_threshold_alert_fires_once(self, broker, monkeypatch):
+        base_url, base_dir = broker
+        (base_dir / agent_api.PERMISSIONS_FILE).write_text(json.dumps(
+            {"allowed": ["OPENAI_API_KEY"], "alerts": {"token_threshold": 100}}))
+        alerts = []
+        monkeypatch.setattr(agent_api, "_send_alert", lambda msg, **kw: alerts.append(msg))
+        for _ in range(4):
+            _request(base_url, "/usage", "POST", data=b'{"key": "K", "tokens": 40}')
+        assert alerts == ["K exceeded 100 tokens"]
+
+    def test_reported_tokens_visible(self, broker):
+        base_url, _ = broker
+        _request(base_url, "/usage", "POST", data=b'{"key": "K", "tokens": 12}')
+        assert _request(base_url, "/usage/K")[1]["tokens"] == 12
+
+
+class TestEnvReload:
+    def test_edit_takes_effect_without_restart(self, broker):
+        base_url, base_dir = broker
+        assert _request(base_url, "/health")[1]["credentials_loaded"] == 3
+        (base_dir / ".env").write_text("OPENAI_API_KEY=sk-rotated\nMISSING_KEY=now-here\n")
+        assert _request(base_url, "/health")[1]["credentials_loaded"] == 2
+        assert _request(base_url, "/credentials/OPENAI_API_KEY", "POST")[1]["value"] == "sk-rotated"
+        assert _request(base_url, "/credentials/MISSING_KEY", "POST")[0] == 200
+        status, body = _request(base_url, "/credentials")
+        assert body["allowed_credentials"] == ["OPENAI_API_KEY", "MISSING_KEY"]
+        assert "anthropic" not in _request(base_url, "/providers")[1]["providers"]
+
+    def test_permissions_edit_does_not_reparse_env(self, broker, monkeypatch):
+        base_url, base_dir = broker
+        calls = []
+        monkeypatch.setattr(agent_api, "_load_env", lambda p: calls.append(p) or {})
+        _write_perms(base_dir, ["ANTHROPIC_API_KEY"])
+        assert _request(base_url, "/credentials/ANTHROPIC_API_KEY", "POST")[0] == 200
+        assert calls == []
+
+
+class TestAccessLog:
+    def test_grant_and_denial_logged(self, broker):
+        base_url, base_dir = broker
+        _request(base_url, "/credentials/OPENAI_API_KEY", "POST")
+        _request(base_url, "/credentials/OTHER_VAR", "POST")
+        agent_api._flush_logs()
+        entries = [json.loads(l) for l in (base_dir / agent_api.LOG_FILE).read_text().splitlines()]
+        events = [(e["event"], e["env_var"], e["granted"]) for e in entries]
+        assert ("credential_granted", "OPENAI_API_KEY", True) in events
+        assert ("credential_denied", "OTHER_VAR", False) in events
+
+    def test_ts_formatted_by_writer(self, tmp_path):
+        ns = 1_700_000_000_123_456_789
+        assert agent_api._iso_ts(ns) == "2023-11-14T22:13:20.123456+00:00"
+        assert agent_api._iso_ts(ns - 123_456_789) == "2023-11-14T22:13:20+00:00"
+        assert agent_api._iso_ts(ns + 1_000_000_000) == "2023-11-14T22:13:21.123456+00:00"
+        agent_api._log_access(tmp_path, "probe", env_var="X")
+        agent_api._flush_logs()
+        line = (tmp_path / agent_api.LOG_FILE).read_text().splitlines()[-1]
+        entry = json.loads(line)
+        assert list(entry)[0] == "ts"
+        assert datetime.fromisoformat(entry["ts"]).tzinfo is not None
+        assert entry["event"] == "probe"
+
+    def test_reopens_after_rotation(self, tmp_path):
+        log = tmp_path / agent_api.LOG_FILE
+        agent_api._log_access(tmp_path, "before")
+        agent_api._flush_logs()
+        log.rename(tmp_path / "rotated.log")
+        agent_api._log_access(tmp_path, "after")
+        agent_api._flush_logs()
+        assert [json.loads(l)["event"] for l in log.read_text().splitlines()] == ["after"]
+        assert "before" in (tmp_path / "rotated.log").read_text()
+        assert log.stat().st_mode & 0o777 == 0o600
+
+    @pytest.mark.parametrize("writev", [True, False])
+    def test_batch_is_one_syscall(self, tmp_path, monkeypatch, writev):
+        calls = []
+        real_writev, real_write = os.writev, os.write
+        monkeypatch.setattr(agent_api, "_writev",
+                            (lambda fd, bufs: calls.append(len(bufs)) or real_writev(fd, bufs))
+                            if writev else None)
+        monkeypatch.setattr(agent_api.os, "write",
+                            lambda fd, data: calls.append(1) or real_write(fd, data))
+        path = tmp_path / agent_api.LOG_FILE
+        agent_api._write_log_batch([(path, 0, {"event": f"e{i}"}) for i in range(5)])
+        assert calls == ([5] if writev else [1])
+        assert [json.loads(l)["event"] for l in path.read_text().splitlines()] == [
+            f"e{i}" for i in range(5)]
+
+    @pytest.mark.parametrize("mode,expected", [
+        ("all", ["granted", "denied"]), ("denied", ["denied"]), ("0", []),
+    ])
+    def test_audit_level(self, tmp_path, monkeypatch, mode, expected):
+        monkeypatch.setattr(agent_api, "_AUDIT_LEVEL", agent_api._audit_level(mode))
+        agent_api._log_access(tmp_path, "granted", granted=True)
+        agent_api._log_access(tmp_path, "denied", granted=False)
+        agent_api._flush_logs()
+        log = tmp_path / agent_api.LOG_FILE
+        lines = log.read_text().splitlines() if log.exists() else []
+        assert [json.loads(l)["event"] for l in lines] == expected
+
+    def test_audit_level_parsing(self):
+        assert agent_api._audit_level("ALL") == 2
+        assert agent_api._audit_level("1") == 2
+        assert agent_api._audit_level(" Denied ") == 1
+        assert agent_api._audit_level("off") == 0
@@ -0,0 +1,72 @@
+"""Tests for credential_auditor.audit_log and its JSON helpers."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from credential_auditor import jsonio
+from credential_auditor.audit_log import AuditLog
+
+
+class TestAuditLogFlush:
+    def test_lines_round_trip(self, tmp_path):
+        log = AuditLog(tmp_path / "audit.log")
+        log.log("validate", provider="openai", env_var="OPENAI_API_KEY", status="valid",
+                latency_ms=12.3456, detail="café")
+        log.log("audit_end", extra={"total": 1})
+        log.flush()
+        assert log.entry_count == 0
+        entries = [json.loads(l) for l in (tmp_path / "audit.log").read_text("utf-8").splitlines()]
+        assert [e["event"] for e in entries] == ["validate", "audit_end"]
+        assert entries[0]["detail"] == "café"
+        assert entries[0]["latency_ms"] == 12.346
+        assert entries[1]["total"] == 1
+
+    def test_unserializable_extra_is_stringified(self, tmp_path):
+        log = AuditLog(tmp_path / "audit.log")
+        log.log("odd", extra={"path": tmp_path, "n": 2})
+        log.flush()
+        entry = json.loads((tmp_path / "audit.log").read_text())
+        assert entry["path"] == str(tmp_path)
+        assert entry["n"] == 2
+
+    def test_flush_appends(self, tmp_path):
+        log = AuditLog(tmp_path / "audit.log")
+        for event in ("a", "b"):
+            log.log(event)
+            log.flush()
+        assert len((tmp_path / "audit.log").read_bytes().splitlines()) == 2
+
+    def test_rotates_on_tracked_size(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(AuditLog, "MAX_SIZE", 200)
+        path = tmp_path / "audit.log"
+        path.write_bytes(b"x" * 150 + b"\n")
+        log = AuditLog(path)
+        log.log("first", detail="y" * 60)
+        log.flush()  # 151 bytes at start: no rotation yet
+        assert not path.with_suffix(".log.1").exists()
+        log.log("second")
+        log.flush()
+        assert b"first" in path.with_suffix(".log.1").read_bytes()
+        assert [json.loads(l)["event"] for l in path.read_text().splitlines()] == ["second"]
+
+    def test_creates_parent_dir(self, tmp_path):
+        log = AuditLog(tmp_path / "logs" / "audit.log")
+        log.log("x")
+        log.flush()
+        assert (tmp_path / "logs" / "audit.log").exists()
+
+
+class TestJsonIO:
+    DATA = {"a": [1, 2.5, None, True], "é": "ü ", 3: "int key"}
+
+    @pytest.mark.parametrize("indent", [False, True])
+    def test_matches_stdlib(self, indent):
+        kwargs = {"indent": 2} if indent else {"separators": (",", ":")}
+        assert jsonio.dumps(self.DATA, indent=indent) == json.dumps(
+            self.DATA, ensure_ascii=False, **kwargs).encode()
+
+    def test_loads_bytes(self):
+        assert jsonio.loads(b'{"k": [1]}') == {"k": [1]}
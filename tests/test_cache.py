@@ -0,0 +1,76 @@
+"""Tests for credential_auditor.cache — eviction order, bulk lookups and key format."""
+
+from __future__ import annotations
+
+import builtins
+import hashlib
+import importlib.util
+import sys
+
+import pytest
+
+from credential_auditor.cache import ValidationCache, cache_key
+from credential_auditor.models import KeyFingerprint, KeyResult
+
+
+def _result(key: str) -> KeyResult:
+    return KeyResult(provider="p", env_var="X",
+                     key_fingerprint=KeyFingerprint.from_key(key), status="valid")
+
+
+class TestEviction:
+    def test_evicts_least_recently_used(self):
+        cache = ValidationCache(max_size=3)
+        for key in ("a", "b", "c"):
+            cache.put("p", key, _result(key))
+        assert cache.get("p", "a") is not None  # a is now most recent
+        cache.put("p", "b", _result("b"))  # re-put refreshes b without evicting
+        assert len(cache) == 3
+        cache.put("p", "d", _result("d"))
+        assert cache.get("p", "c") is None
+        assert all(cache.get("p", k) is not None for k in ("a", "b", "d"))
+
+
+class TestBulkGet:
+    def test_matches_get(self):
+        cache = ValidationCache(max_size=3)
+        results = {k: _result(k) for k in ("a", "b", "c")}
+        for key, r in results.items():
+            cache.put("p", key, r)
+        got = cache.bulk_get([cache_key("p", k) for k in ("a", "zz", "c")])
+        assert got == [results["a"], None, results["c"]]
+        assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+        cache.put("p", "d", results["a"])  # b was not touched, so it is evicted
+        assert cache.get("p", "b") is None
+
+
+class TestCacheKey:
+    def test_short_hex_digest(self):
+        ck = cache_key("openai", "sk-secret")
+        assert len(ck) == 16 and int(ck, 16) >= 0
+        assert "secret" not in ck
+        assert ck != cache_key("anthropic", "sk-secret")
+        assert ck == cache_key("openai", "sk-secret")
+
+    def test_stdlib_fallback_without_blake3(self, monkeypatch):
+        real_import = builtins.__import__
+
+        def no_blake3(name, *args, **kwargs):
+            if name == "blake3":
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", no_blake3)
+        monkeypatch.delitem(sys.modules, "blake3", raising=False)
+        spec = importlib.util.find_spec("credential_auditor.cache")
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        assert mod._blake3 is None
+        ck = mod.cache_key("openai", "sk-secret")
+        assert len(ck) == 16
+        assert ck == hashlib.blake2b(b"openai:sk-secret", digest_size=8).hexdigest()
+
+    def test_blake3_digest_when_installed(self):
+        blake3 = pytest.importorskip("blake3")
+        ck = cache_key("openai", "sk-secret")
+        assert ck == blake3.blake3(b"openai:sk-secret").hexdigest(length=8)
@@ -74,6 +74,17 @@ class TestNetworkFailureInjection:
         d = _safe_json(response)
         assert d == {}
 
+    @pytest.mark.parametrize("content,expected", [
+        (b'{"data": [{"id": "gpt-4"}], "name": "caf\xc3\xa9"}', {"data": [{"id": "gpt-4"}], "name": "café"}),
+        (b'[1, 2]', {}),  # only objects are accepted
+        (b'\xff\xfe{}', {}),  # not UTF-8
+    ])
+    def test_safe_json_decodes_raw_bytes(self, content, expected):
+        from credential_auditor.providers import _safe_json
+
+        response = httpx.Response(200, content=content, headers={"content-type": "application/json"})
+        assert _safe_json(response) == expected
+
 
 # ── Partial failure isolation ─────────────────────────────────────────────
 
@@ -70,3 +70,21 @@ class TestShellCompletion:
             result = _run_cli("--completion", shell)
             assert result.returncode == 0
             assert result.stderr == "", f"Unexpected stderr for {shell}: {result.stderr}"
+
+
+class TestStartupImports:
+    def test_version_and_completion_skip_provider_imports(self):
+        """Trivial invocations don't import httpx/asyncio or any provider module."""
+        for args in (("--version",), ("--completion", "bash")):
+            result = subprocess.run(
+                [sys.executable, "-X", "importtime", "-m", "credential_auditor", *args],
+                capture_output=True, text=True, cwd=str(REPO), timeout=10,
+            )
+            assert result.returncode == 0
+            imported = {line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()}
+            assert not {"httpx", "asyncio", "credential_auditor.providers"} & imported
+
+    def test_help_still_lists_providers(self):
+        result = _run_cli("--help")
+        assert result.returncode == 0
+        assert "Available: anthropic" in result.stdout
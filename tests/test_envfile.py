@@ -0,0 +1,59 @@
+"""Tests for credential_auditor.envfile — fast path must agree with python-dotenv."""
+
+from __future__ import annotations
+
+import io
+import sys
+
+import pytest
+from dotenv import dotenv_values
+
+from credential_auditor.envfile import parse_simple, read_env
+
+PLAIN = (
+    "# credentials\n\n"
+    "OPENAI_API_KEY=sk-abc123\n"
+    "export ANTHROPIC_API_KEY='sk-ant-xyz'\n"
+    'GREETING="hello world"\r\n'
+    " SPACED = value with spaces \n"
+    "EMPTY=\n"
+)
+
+
+class TestParseSimple:
+    def test_matches_dotenv(self):
+        assert parse_simple(PLAIN) == dict(dotenv_values(stream=io.StringIO(PLAIN)))
+
+    @pytest.mark.parametrize("line", [
+        "A=1 # comment",
+        "A=${B}",
+        'A="esc\\"aped"',
+        'A="multi',
+        "BARE_KEY",
+        "'QUOTED'=1",
+        "A='a\\\\b'",
+        "A='a\\'",
+    ])
+    def test_defers_complex_lines(self, line):
+        assert parse_simple(f"OK=1\n{line}\n") is None
+
+    @pytest.mark.parametrize("text", ["A='a\\\\b'\n", "A='a\\'\nB=1\n"])
+    def test_single_quoted_escapes_match_dotenv(self, tmp_path, text):
+        (tmp_path / ".env").write_text(text)
+        assert read_env(tmp_path / ".env") == dict(dotenv_values(stream=io.StringIO(text)))
+
+
+class TestReadEnv:
+    def test_plain_file_skips_dotenv(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(sys.modules, "dotenv", None)  # import would raise
+        (tmp_path / ".env").write_text(PLAIN)
+        env = read_env(tmp_path / ".env")
+        assert env["ANTHROPIC_API_KEY"] == "sk-ant-xyz"
+        assert env["EMPTY"] == ""
+
+    def test_complex_file_uses_dotenv(self, tmp_path):
+        (tmp_path / ".env").write_text("A=1\nB=${A}-2 # note\n")
+        assert read_env(tmp_path / ".env") == {"A": "1", "B": "1-2"}
+
+    def test_missing_file(self, tmp_path):
+        assert read_env(tmp_path / "nope.env") == {}
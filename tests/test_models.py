@@ -2,6 +2,8 @@
 
 import json
 
+import pytest
+
 from credential_auditor.models import (
     AuditSummary,
     FAILING_STATUSES,
@@ -91,12 +93,40 @@ class TestKeyResult:
         j2 = json.dumps(r.to_dict())
         assert j1 == j2
 
-    def test_latency_rounded(self):
+    def test_latency_emitted_as_stored(self):
         fp = KeyFingerprint(prefix="a", suffix="b", length=5)
         r = KeyResult(provider="x", env_var="Y", key_fingerprint=fp,
-                      status="valid", latency_ms=1.23456789)
+                      status="valid", latency_ms=1.23)
         assert r.to_dict()["latency_ms"] == 1.23
 
+    def test_slotted_and_frozen(self):
+        from dataclasses import FrozenInstanceError, replace
+
+        fp = KeyFingerprint(prefix="a", suffix="b", length=5)
+        r = KeyResult(provider="x", env_var="Y", key_fingerprint=fp, status="valid")
+        assert not hasattr(r, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            r.status = "auth_failed"  # type: ignore[misc]
+        assert replace(r, auto_detected=True).auto_detected is True
+
+
+class TestWriteJson:
+    def test_matches_stdlib_document(self, tmp_path):
+        from rich.console import Console
+
+        from credential_auditor.output import write_json
+
+        fp = KeyFingerprint(prefix="sk-t", suffix="xyz1", length=51)
+        results = [KeyResult(provider="openai", env_var="OPENAI_API_KEY", key_fingerprint=fp,
+                             status="valid", account_info="café org", latency_ms=12.5)]
+        out = tmp_path / "report.json"
+        out.touch(mode=0o600)
+        assert write_json(results, out, console=Console(quiet=True))
+        text = out.read_text(encoding="utf-8")
+        expected = [r.to_dict() for r in results]
+        assert json.loads(text) == expected
+        assert text == json.dumps(expected, indent=2, ensure_ascii=False) + "\n"
+
 
 class TestAuditSummary:
     def test_avg_latency(self):
@@ -129,3 +159,21 @@ class TestStatusSets:
             "auth_failed", "suspended_account",
             "quota_exhausted", "insufficient_scope",
         }
+
+
+class TestRenderTable:
+    @pytest.mark.parametrize("level,shown", [
+        ("partial", "sk-t...xyz1 (51)"),
+        ("hash", "[sha256:abc123]"),
+        ("full", "[REDACTED]"),
+    ])
+    def test_fingerprint_rendered_literally(self, level, shown):
+        from rich.console import Console
+
+        from credential_auditor.output import render_table
+
+        fp = KeyFingerprint(prefix="sk-t", suffix="xyz1", length=51, key_hash="abc123")
+        r = KeyResult(provider="openai", env_var="OPENAI_API_KEY", key_fingerprint=fp, status="valid")
+        console = Console(record=True, width=200)
+        render_table([r], console=console, redaction_level=level)
+        assert shown in console.export_text()
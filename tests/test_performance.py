@@ -7,6 +7,7 @@ Tests measure end-to-end operations on synthetic inputs — no real network.
 from __future__ import annotations
 
 import hashlib
+import os
 import re
 import time
 
@@ -226,3 +227,128 @@ class TestEndToEndPerformance:
         # but auto-detect will pick them up. At minimum 1 result returned.
         assert len(results) >= 1
         assert elapsed < 2.0, f"Audit took {elapsed:.2f}s >= 2s baseline"
+
+    @pytest.mark.asyncio
+    async def test_fully_cached_audit_skips_client(self, tmp_path, monkeypatch):
+        """A run where every key is a cache hit must not build an HTTP client."""
+        import credential_auditor.orchestrator as orch
+
+        key = "sk-" + hashlib.sha256(b"cached").hexdigest()[:48]
+        env = tmp_path / ".env"
+        env.write_text(f"OPENAI_API_KEY={key}\n")
+        orch.get_cache().put("openai", key, KeyResult(
+            provider="openai", env_var="OPENAI_API_KEY",
+            key_fingerprint=KeyFingerprint.from_key(key), status="valid",
+        ))
+
+        def _no_client(*args, **kwargs):
+            raise AssertionError("AsyncClient built for a fully cached audit")
+
+        monkeypatch.setattr(orch.httpx, "AsyncClient", _no_client)
+        results = await orch.audit(env, providers=["openai"], timeout=10)
+        assert [r.status for r in results] == ["valid"]
+        assert results.summary.cache_hits >= 1
+
+    @pytest.mark.asyncio
+    async def test_summary_counts_in_one_pass(self, tmp_path, monkeypatch):
+        """Summary counters must agree with the per-status tallies of the results."""
+        import credential_auditor.orchestrator as orch
+
+        statuses = ["valid", "auth_failed", "network_error", "quota_exhausted", "valid"]
+        lines = []
+        for i, status in enumerate(statuses):
+            var = "OPENAI_API_KEY" if i == 0 else f"OPENAI_API_KEY_ALT{i}"
+            key = "sk-" + hashlib.sha256(f"summary{i}".encode()).hexdigest()[:48]
+            lines.append(f"{var}={key}")
+            orch.get_cache().put("openai", key, KeyResult(
+                provider="openai", env_var=var, key_fingerprint=KeyFingerprint.from_key(key),
+                status=status, latency_ms=10.0 * (i + 1),
+            ))
+        env = tmp_path / ".env"
+        env.write_text("\n".join(lines) + "\n")
+
+        monkeypatch.setattr(orch.httpx, "AsyncClient", None)  # all cached: no network
+        summary = (await orch.audit(env, providers=["openai"], timeout=10)).summary
+        assert (summary.total_keys, summary.valid, summary.failed, summary.errors) == (5, 2, 2, 1)
+        assert summary.total_latency_ms == pytest.approx(150.0)
+
+    @pytest.mark.asyncio
+    async def test_companion_vars_injected_then_restored(self, tmp_path, monkeypatch):
+        import credential_auditor.orchestrator as orch
+
+        monkeypatch.setenv("TWILIO_ACCOUNT_SID", "ACprior")
+        env = tmp_path / ".env"
+        env.write_text("TWILIO_ACCOUNT_SID=ACfromfile\nDATABASE_URL=postgres://x\n")
+        seen = {}
+        real_matcher = orch.env_var_matcher
+
+        def _spy(providers):
+            seen.update(os.environ)
+            return real_matcher(providers)
+
+        monkeypatch.setattr(orch, "env_var_matcher", _spy)
+        await orch.audit(env, providers=["openai"], timeout=10)
+        assert seen["TWILIO_ACCOUNT_SID"] == "ACfromfile"
+        assert "DATABASE_URL" not in seen  # only allowlisted companions are exposed
+        assert os.environ["TWILIO_ACCOUNT_SID"] == "ACprior"
+
+    @pytest.mark.asyncio
+    async def test_client_skips_http2_without_h2(self, tmp_path, monkeypatch):
+        """Without h2 installed the client must be built HTTP/1.1, not crash."""
+        import credential_auditor.orchestrator as orch
+
+        captured = {}
+
+        def _spy(**kwargs):
+            captured.update(kwargs)
+            raise RuntimeError("stop before network")
+
+        key = "sk-" + hashlib.sha256(b"http2-fallback").hexdigest()[:48]
+        env = tmp_path / ".env"
+        env.write_text(f"OPENAI_API_KEY={key}\n")
+        monkeypatch.setattr(orch, "_HTTP2", False)
+        monkeypatch.setattr(orch.httpx, "AsyncClient", _spy)
+        with pytest.raises(RuntimeError):
+            await orch.audit(env, providers=["openai"], timeout=10)
+        assert captured["http2"] is False
+        assert captured["max_redirects"] == 0
+
+    @pytest.mark.asyncio
+    async def test_checks_bounded_and_exceptions_isolated(self, tmp_path, monkeypatch):
+        """At most _CONCURRENCY_LIMIT checks run at once; one crash costs one key."""
+        import asyncio
+
+        import credential_auditor.orchestrator as orch
+
+        active = peak = 0
+        prov = Provider.get_registry()["openai"]
+
+        async def _check(self, env_var, key, client):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            if env_var.endswith("_ALT7"):
+                raise ValueError("provider bug")
+            return KeyResult(provider="openai", env_var=env_var,
+                             key_fingerprint=KeyFingerprint.from_key(key), status="valid")
+
+        lines = [
+            f"OPENAI_API_KEY_ALT{i}=sk-" + hashlib.sha256(f"pool{i}".encode()).hexdigest()[:48]
+            for i in range(3 * orch._CONCURRENCY_LIMIT)
+        ]
+        env = tmp_path / ".env"
+        env.write_text("\n".join(lines) + "\n")
+        outcomes = []
+        monkeypatch.setattr(orch, "_record_circuit_result", lambda name, ok: outcomes.append(ok))
+        monkeypatch.setattr(prov, "check_key", _check)
+        results = await orch.audit(env, providers=["openai"], timeout=10)
+        assert len(results) == len(lines)
+        assert 1 < peak <= orch._CONCURRENCY_LIMIT
+        crashed = [r for r in results if r.env_var.endswith("_ALT7")]
+        assert crashed[0].status == "network_error"
+        assert crashed[0].error_detail == "ValueError: provider bug"
+        assert sum(r.status == "valid" for r in results) == len(lines) - 1
+        # The crash still counts against the provider's circuit breaker
+        assert outcomes.count(False) == 1
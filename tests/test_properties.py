@@ -15,7 +15,7 @@ import pytest
 hypothesis = pytest.importorskip("hypothesis")
 from hypothesis import HealthCheck, given, settings, strategies as st
 
-from credential_auditor.cache import CacheStats, ValidationCache
+from credential_auditor.cache import CacheStats, ValidationCache, cache_key
 from credential_auditor.models import (
     VALID_STATUSES,
     AuditSummary,
@@ -113,6 +113,22 @@ class TestValidationCacheProperties:
         assert got.status == "valid"
         assert got.provider == provider
 
+    @given(
+        provider=st.text(min_size=1, max_size=32),
+        key=st.text(min_size=1, max_size=64),
+    )
+    @settings(max_examples=100)
+    def test_precomputed_hash_matches(self, provider: str, key: str) -> None:
+        """INV: passing ck=cache_key(...) is the same entry; raw keys are never stored."""
+        cache = ValidationCache()
+        ck = cache_key(provider, key)
+        r = KeyResult(provider=provider, env_var="X",
+                      key_fingerprint=KeyFingerprint.from_key(key), status="valid")
+        cache.put(provider, key, r, ck=ck)
+        assert cache.get(provider, key) is r
+        assert cache.get(provider, key, ck=ck) is r
+        assert list(cache._store) == [ck]
+
     @given(
         provider=st.text(min_size=1, max_size=32),
         key=st.text(min_size=1, max_size=64),
@@ -1,13 +1,16 @@
 """Tests for provider registry, matching, and format checking."""
 
+import asyncio
 import re
 
+import httpx
 import pytest
 
 from credential_auditor.providers import (
     Provider,
     detect_provider_by_key,
     discover_providers,
+    env_var_matcher,
     _literal_prefix_len,
 )
 
@@ -35,6 +38,19 @@ class TestRegistry:
         with pytest.raises(ValueError, match="Unknown provider"):
             Provider.get_provider("nonexistent_provider_xyz")
 
+    def test_registry_view_is_read_only(self):
+        reg = Provider.get_registry()
+        assert reg is Provider.get_registry()
+        with pytest.raises(TypeError):
+            reg["x"] = Provider  # type: ignore[index]
+
+    def test_discover_scans_package_once(self, monkeypatch):
+        import pkgutil
+
+        monkeypatch.setattr(pkgutil, "iter_modules", lambda *a, **k: pytest.fail("rescanned"))
+        discover_providers()
+        assert len(Provider.get_registry()) == 16
+
 
 class TestEnvVarMatching:
     @pytest.mark.parametrize("provider,env_var", [
@@ -61,6 +77,67 @@ class TestEnvVarMatching:
         assert not p.matches_env_var(env_var)
 
 
+class TestEnvVarMatcher:
+    NAMES = ["OPENAI_API_KEY", "OPENAI_API_KEY_ALT2", "GITHUB_PAT", "GH_TOKEN_ALT1",
+             "STRIPE_SECRET_KEY", "SLACK_BOT_TOKEN", "RANDOM_KEY", "", "OPENAI_API_KEY_X"]
+
+    @staticmethod
+    def _first_match(reg, var):
+        return next((n for n, cls in reg.items() if cls.matches_env_var(var)), None)
+
+    def test_union_agrees_with_per_provider(self):
+        reg = Provider.get_registry()
+        match = env_var_matcher(reg)
+        assert match.__name__ == "match_union"
+        for var in self.NAMES:
+            assert match(var) == self._first_match(reg, var), var
+
+    def test_subset_and_empty(self):
+        reg = Provider.get_registry()
+        match = env_var_matcher({"github": reg["github"]})
+        assert match("GH_TOKEN") == "github"
+        assert match("OPENAI_API_KEY") is None
+        assert env_var_matcher({})("OPENAI_API_KEY") is None
+
+    def test_override_falls_back(self):
+        class _Custom(Provider):
+            env_patterns = []
+            key_format = re.compile(r"^x$")
+
+            @classmethod
+            def matches_env_var(cls, env_var):
+                return env_var.endswith("_CUSTOM")
+
+            async def validate(self, key, client):
+                raise NotImplementedError
+
+        reg = Provider.get_registry()
+        match = env_var_matcher({"custom": _Custom, "openai": reg["openai"]})
+        assert match.__name__ == "match_each"
+        assert match("X_CUSTOM") == "custom"
+        assert match("OPENAI_API_KEY") == "openai"
+
+    def test_instance_method_override_bound_once(self):
+        made = []
+
+        class _Custom(Provider):
+            env_patterns = []
+            key_format = re.compile(r"^x$")
+
+            def __init__(self):
+                made.append(self)
+
+            def matches_env_var(self, env_var):
+                return env_var.endswith("_CUSTOM")
+
+            async def validate(self, key, client):
+                raise NotImplementedError
+
+        match = env_var_matcher({"custom": _Custom})
+        assert [match(v) for v in ("A_CUSTOM", "B_CUSTOM", "OTHER")] == ["custom", "custom", None]
+        assert len(made) == 1
+
+
 class TestKeyFormatCheck:
     @pytest.mark.parametrize("provider,key", [
         ("openai", "sk-" + "a" * 48),
@@ -80,6 +157,10 @@ class TestKeyFormatCheck:
         ("github", "bad-token"),
         ("anthropic", "sk-wrong-prefix"),
         ("groq", "invalid"),
+        # _ALT numbering belongs to env var names, never to key values
+        ("huggingface", "hf_" + "A" * 30 + "_ALT1"),
+        ("slack", "xoxb-" + "1" * 20 + "_ALT2"),
+        ("stripe", "sk_live_" + "A" * 24 + "_ALT1"),
     ])
     def test_invalid_format(self, provider, key):
         p = Provider.get_provider(provider)
@@ -114,6 +195,23 @@ class TestAutoDetect:
         assert p is not None
         assert p.name == "anthropic"
 
+    def test_combined_matcher_agrees_with_ranked_scan(self):
+        from credential_auditor.providers import _key_format_matcher, _ranked_providers
+
+        classes = tuple(Provider._registry.values())
+        match = _key_format_matcher(classes)
+        assert match.__name__ == "match_union"
+        keys = [
+            "sk-proj-" + "A" * 40, "sk-ant-" + "a" * 40, "sk-or-v1-" + "a" * 64,
+            "sk-" + "a" * 32, "ghp_" + "A" * 36, "gsk_" + "A" * 48, "hf_" + "A" * 30,
+            "csk-" + "a" * 40, "nvapi-" + "A" * 40, "AIza" + "A" * 35, "xoxb-" + "1" * 20,
+            "SG." + "a" * 22 + "." + "b" * 43, "sk_live_" + "A" * 24, "a" * 64, "a" * 32,
+            "A" * 25, "totally-random-string", "",
+        ]
+        for key in keys:
+            expected = next((c for c in _ranked_providers(classes) if c.key_format.match(key)), None)
+            assert match(key) is expected, key
+
 
 class TestLiteralPrefixLen:
     def test_simple(self):
@@ -144,3 +242,48 @@ class TestDynamicRegistration:
         assert "_test_dynamic" in Provider.get_registry()
         assert "_test_dynamic" not in before
         Provider._registry.pop("_test_dynamic", None)
+
+
+class TestCheckKeyErrors:
+    @staticmethod
+    def _provider(exc):
+        class _Raising(Provider):
+            name = ""  # unnamed: stays out of the registry
+            env_patterns = []
+            key_format = re.compile(r"^k$")
+
+            async def validate(self, key, client):
+                raise exc
+
+        return _Raising()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("exc", [
+        httpx.ConnectError("refused"), ConnectionResetError(), asyncio.TimeoutError(),
+    ])
+    async def test_transport_errors_become_network_error(self, exc):
+        result = await self._provider(exc).check_key("K", "k", None)
+        assert result.status == "network_error"
+        assert result.error_detail.startswith(type(exc).__name__)
+
+    @pytest.mark.asyncio
+    async def test_provider_bugs_propagate(self):
+        with pytest.raises(KeyError):
+            await self._provider(KeyError("account")).check_key("K", "k", None)
+
+    @pytest.mark.asyncio
+    async def test_latency_rounded_at_construction(self):
+        result = await self._provider(httpx.ConnectError("refused")).check_key("K", "k", None)
+        assert result.latency_ms == round(result.latency_ms, 2)
+
+
+class TestTwilioAccountSid:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sid,detail", [
+        ("", "TWILIO_ACCOUNT_SID not set"),
+        ("AC../../evil", "Invalid TWILIO_ACCOUNT_SID format"),
+    ])
+    async def test_sid_checked_before_request(self, monkeypatch, sid, detail):
+        monkeypatch.setenv("TWILIO_ACCOUNT_SID", sid)
+        status, *_, error = await Provider.get_provider("twilio").validate("a" * 32, None)
+        assert (status, error) == ("network_error", detail)
@@ -42,6 +42,146 @@ class TestUsageTrackerNoDeadlock:
         assert tracker.check_rpm("K", 5) is not None
         assert tracker.check_rpm("K", 10) is None
 
+    def test_rpm_window_slides(self, tmp_path, monkeypatch):
+        now = [1_000_000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        tracker = _UsageTracker(tmp_path)
+        tracker.record_request("K")
+        now[0] += 30
+        tracker.record_request("K")
+        tracker.record_request("K")
+        assert tracker.get_rpm("K") == 3
+        now[0] += 30  # first request is now 60s old
+        assert tracker.get_rpm("K") == 2
+        assert tracker.check_rpm("K", 2) == "rate limit exceeded: 2/2 RPM for K"
+        now[0] += 29
+        assert tracker.get_rpm("K") == 2
+        now[0] += 1
+        assert tracker.get_rpm("K") == 0
+        assert "K" not in tracker._rpm_windows
+
+    def test_rpm_window_ignores_wall_clock(self, tmp_path, monkeypatch):
+        tracker = _UsageTracker(tmp_path)
+        tracker.record_request("K")
+        monkeypatch.setattr(time, "time", lambda: 0.0)
+        assert tracker.get_rpm("K") == 1
+
+    def test_rpm_window_long_gap_and_step_back(self, tmp_path, monkeypatch):
+        now = [1_000_000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        tracker = _UsageTracker(tmp_path)
+        for _ in range(3):
+            tracker.record_request("K")
+        now[0] += 3600
+        tracker.record_request("K")
+        assert tracker.get_rpm("K") == 1
+        now[0] -= 5
+        tracker.record_request("K")
+        assert tracker.get_rpm("K") == 2
+
+
+class TestUsageCounters:
+    def test_counts_accumulate(self, tmp_path):
+        tracker = _UsageTracker(tmp_path)
+        tracker.record_request("K")
+        tracker.record_request("K")
+        tracker.record_tokens("K", 5, agent="a")
+        tracker.record_tokens("K", 6, agent="a")
+        tracker.record_tokens("T", 1)
+        assert tracker.summary("K")["requests"] == 2
+        assert tracker.summary("K")["tokens"] == 11
+        assert tracker._tokens_by_agent[("K", "a")] == 11
+        assert set(tracker.summary()) == {"K", "T"}
+
+    def test_concurrent_updates_across_shards(self, tmp_path):
+        tracker = _UsageTracker(tmp_path)
+        keys = [f"KEY_{i}" for i in range(40)]
+        errors = []
+
+        def hammer(key):
+            for _ in range(200):
+                tracker.record_request(key)
+
+        def snapshot():
+            try:
+                for _ in range(200):
+                    tracker.summary()
+            except Exception as exc:  # pragma: no cover
+                errors.append(exc)
+
+        threads = [threading.Thread(target=hammer, args=(k,)) for k in keys]
+        threads.append(threading.Thread(target=snapshot))
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join(timeout=10)
+        assert not errors
+        summary = tracker.summary()
+        assert all(summary[k]["requests"] == 200 for k in keys)
+
+    def test_record_tokens_returns_total(self, tmp_path):
+        tracker = _UsageTracker(tmp_path)
+        assert tracker.record_tokens("K", 5) == 5
+        assert tracker.record_tokens("K", 7, agent="a") == 12
+        assert tracker.record_tokens("T", 1) == 1
+
+    def test_lookup_does_not_create_keys(self, tmp_path):
+        tracker = _UsageTracker(tmp_path)
+        assert tracker.summary("nope") == {"key": "nope", "requests": 0, "tokens": 0, "rpm": 0}
+        assert tracker.summary() == {}
+
+
+class TestUsageLog:
+    def test_record_tokens_appends_line(self, tmp_path):
+        import json
+
+        from agent_api import USAGE_LOG, _flush_logs
+        tracker = _UsageTracker(tmp_path)
+        tracker.record_tokens("K", 7, agent="a", model="m")
+        tracker.record_tokens("K", 3)
+        _flush_logs()
+        lines = [json.loads(l) for l in (tmp_path / USAGE_LOG).read_text().splitlines()]
+        assert [(e["key"], e["tokens"], e["agent"], e["model"]) for e in lines] == [
+            ("K", 7, "a", "m"), ("K", 3, "", "")]
+        assert all(list(e)[0] == "ts" for e in lines)
+
+
+class TestWebhookAlerts:
+    def test_delivery_does_not_block_caller(self, monkeypatch):
+        import json
+
+        import agent_api
+        sent = []
+
+        def slow_urlopen(req, timeout):
+            time.sleep(0.5)
+            sent.append((req.full_url, json.loads(req.data)))
+            raise OSError("unreachable")
+
+        monkeypatch.setattr(agent_api.urllib.request, "urlopen", slow_urlopen)
+        start = time.monotonic()
+        agent_api._send_alert("over limit", webhook="https://hooks.example.com/x", key="K")
+        assert time.monotonic() - start < 0.25
+        agent_api._webhook_q.join()
+        assert sent == [("https://hooks.example.com/x",
+                         {"text": "🔔 check_please: over limit", "key": "K", "agent": ""})]
+
+    def test_dropped_alerts_reported(self, monkeypatch, capsys):
+        import agent_api
+        monkeypatch.setattr(agent_api.urllib.request, "urlopen", lambda req, timeout: None)
+        monkeypatch.setattr(agent_api, "_webhook_dropped", 3)
+        agent_api._send_alert("over limit", webhook="https://hooks.example.com/x")
+        agent_api._webhook_q.join()
+        assert "3 webhook alert(s) dropped" in capsys.readouterr().err
+        assert agent_api._webhook_dropped == 0
+
+    def test_rejected_webhook_not_queued(self, monkeypatch):
+        import agent_api
+        monkeypatch.setattr(agent_api, "_enqueue_webhook",
+                            lambda *a: (_ for _ in ()).throw(AssertionError("queued")))
+        agent_api._send_alert("x", webhook="http://hooks.example.com/x")
+        agent_api._send_alert("x", webhook="https://127.0.0.1/x")
+
 
 class TestParseDurationEdge:
     def test_empty(self):
@@ -60,6 +200,12 @@ class TestParseDurationEdge:
         assert _parse_duration("2h") == 7200
         assert _parse_duration("1d") == 86400
 
+    def test_suffix_variants(self):
+        assert _parse_duration("30M") == 1800
+        assert _parse_duration(" 1.5h ") == 5400
+        assert _parse_duration("m") == 0
+        assert _parse_duration("   ") == 0
+
 
 class TestHmacCompareAvailable:
     def test_module_exports_hmac(self):
@@ -68,3 +214,39 @@ class TestHmacCompareAvailable:
         b = "token-bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb"
         assert hmac.compare_digest(a, a) is True
         assert hmac.compare_digest(a, b) is False
+
+
+class TestDumps:
+    def test_returns_bytes_that_round_trip(self):
+        import json
+
+        from agent_api import _dumps
+        data = {"env_var": "K", "value": "vé\"", "n": [1, 2], "ok": True}
+        out = _dumps(data)
+        assert isinstance(out, bytes)
+        assert json.loads(out) == data
+
+    def test_compact_output(self):
+        from agent_api import _dumps
+        assert _dumps({"a": [1, 2], "b": "c"}) == b'{"a":[1,2],"b":"c"}'
+
+    def test_stdlib_fallback_is_compact(self, monkeypatch):
+        import builtins
+        import importlib.util
+        import sys
+
+        real_import = builtins.__import__
+
+        def no_orjson(name, *args, **kwargs):
+            if name == "orjson":
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", no_orjson)
+        monkeypatch.delitem(sys.modules, "orjson", raising=False)
+        spec = importlib.util.find_spec("agent_api")
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        assert mod.orjson is None
+        assert mod._dumps({"a": [1, 2], "b": "c"}) == b'{"a":[1,2],"b":"c"}'
+        assert mod._loads(b'{"a": 1}') == {"a": 1}